@@ -6,10 +6,13 @@
 This module defines a small dataclass used to display and select expression
 engine entries in the UI."""
 
-from dataclasses import dataclass
+import sys
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from operator import attrgetter
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExpressionItem:
     """A single expression binding shown in the UI.
 
@@ -29,8 +32,31 @@ class ExpressionItem:
     lhs: str
     rhs: str
     operator: str = "="
+    # Lists sort and render by the display string, so build it once per item.
+    _display_text: str = field(init=False, repr=False, compare=False)
+    # Items are hashed on every selection lookup while rendering; hash once.
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Many items repeat the same owning object; intern its name so populated
+        # lists share one string. The expression text is user-edited and changes
+        # between revisions, so it is not interned (interned strings are immortal).
+        object.__setattr__(self, "object_name", sys.intern(self.object_name))
+        object.__setattr__(self, "_display_text", f"{self.lhs} {self.operator} {self.rhs}")
+        object.__setattr__(
+            self, "_hash", hash((self.object_name, self.lhs, self.rhs, self.operator))
+        )
+
+    def __hash__(self) -> int:
+        """Return the hash computed at construction."""
+        return self._hash
 
     @property
     def display_text(self) -> str:
         """Return the display string shown in the expressions list."""
-        return f"{self.lhs} {self.operator} {self.rhs}"
+        return self._display_text
+
+
+# Sort key for expression lists: the public, precomputed display string, read
+# without a Python-level lambda per item.
+by_display_text: Callable[[ExpressionItem], str] = attrgetter("display_text")
@@ -6,10 +6,13 @@
 The UI stores these objects in `QListWidgetItem` user data to preserve a
 structured representation of `parent.child` identifiers."""
 
-from dataclasses import dataclass
+import sys
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from operator import attrgetter
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ParentChildRef:
     """Structured identifier of a `parent.child` reference.
 
@@ -24,11 +27,20 @@ class ParentChildRef:
 
     parent: str
     child: str
+    # Used as sort key, dictionary key and display text; build it once.
+    _text: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_text", f"{self.parent}.{self.child}")
 
     @property
     def text(self) -> str:
         """Return the canonical `parent.child` string form."""
-        return f"{self.parent}.{self.child}"
+        return self._text
+
+
+# Sort key for reference lists: the public, precomputed `parent.child` string.
+by_text: Callable[[ParentChildRef], str] = attrgetter("text")
 
 
 def parse_parent_child_ref(text: str) -> ParentChildRef | None:
@@ -40,22 +52,16 @@ def parse_parent_child_ref(text: str) -> ParentChildRef | None:
 
     Returns:
         A :class:`ParentChildRef` when parsing succeeds, otherwise ``None``.
+        The parent and child names are interned, since the same names are
+        parsed and used as lookup keys on every selection change.
     """
 
-    if "." not in text:
-        return None
-    parent, child = text.split(".", 1)
+    parent, _sep, child = text.partition(".")
     if not parent or not child:
         return None
-    return ParentChildRef(parent=parent, child=child)
+    return ParentChildRef(parent=sys.intern(parent), child=sys.intern(child))
 
 
 def normalize_parent_child_items(items: list[ParentChildRef] | list[str]) -> list[str]:
     """Normalize a list of selection items to their `parent.child` string form."""
-    normalized: list[str] = []
-    for item in items:
-        if isinstance(item, ParentChildRef):
-            normalized.append(item.text)
-        else:
-            normalized.append(item)
-    return normalized
+    return [item if isinstance(item, str) else item.text for item in items]
@@ -39,8 +39,10 @@ def parse_expression_item_object_name(text: str) -> str | None:
         The owning object name if it can be parsed, otherwise ``None``.
     """
 
-    left = text.split("=", 1)[0].strip()
-    ref = parse_parent_child_ref(left)
-    if ref is None:
+    # Same rule as `parse_parent_child_ref` (non-empty parts on both sides of
+    # the first dot), without building a ref that is thrown away.
+    left = text.partition("=")[0].strip()
+    object_name, _sep, rest = left.partition(".")
+    if not object_name or not rest:
         return None
-    return ref.parent
+    return object_name
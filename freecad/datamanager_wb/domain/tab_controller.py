@@ -8,9 +8,11 @@ orchestration against a `TabDataSource`.
 """
 
 import fnmatch
+import re
+from collections.abc import Callable
 
 from .expression_item import ExpressionItem
-from .parent_child_ref import ParentChildRef, normalize_parent_child_items
+from .parent_child_ref import ParentChildRef
 from .tab_datasource import (
     PostRemoveUpdate,
     RemoveUnusedAndUpdateResult,
@@ -18,6 +20,40 @@ from .tab_datasource import (
     TabDataSource,
 )
 
+_GLOB_CHARS_SEARCH = re.compile(r"[*?\[\]]").search
+
+
+def _normalize_glob_pattern(text: str) -> str | None:
+    stripped = text.strip()
+    if not stripped:
+        return None
+
+    if _GLOB_CHARS_SEARCH(stripped) is None:
+        return f"*{stripped}*"
+
+    return stripped
+
+
+def compile_glob_matcher(text: str) -> Callable[[str], object] | None:
+    """Compile user filter text into a name matcher.
+
+    Text containing glob characters (``*?[]``) is used as a glob pattern that
+    must match the whole name; any other text is treated as a substring match.
+
+    Args:
+        text: User-entered filter text.
+
+    Returns:
+        A callable returning a truthy value for matching names, or ``None``
+        when the filter is blank and everything matches.
+    """
+    # Equivalent to `fnmatch.fnmatchcase(name, pattern)`, but translates and
+    # compiles the pattern once per filter pass instead of once per item.
+    pattern = _normalize_glob_pattern(text)
+    if pattern is None:
+        return None
+    return re.compile(fnmatch.translate(pattern)).match
+
 
 class TabController:
     """Tab-generic controller logic shared across domains.
@@ -57,27 +93,13 @@ class TabController:
     ) -> bool:
         """Return whether the given selection is eligible for remove-unused.
 
-        This is a convenience wrapper that normalizes the selection and then
-        applies `should_enable_remove_unused`.
+        This is a convenience wrapper that applies `should_enable_remove_unused`
+        to the number of selected items. The items themselves are not parsed.
         """
-        normalized = self._normalize_items(selected_items)
         return self.should_enable_remove_unused(
-            only_unused=only_unused, selected_count=len(normalized)
+            only_unused=only_unused, selected_count=len(selected_items)
         )
 
-    def _normalize_items(self, items: list[ParentChildRef] | list[str]) -> list[str]:
-        return normalize_parent_child_items(items)
-
-    def _normalize_glob_pattern(self, text: str) -> str | None:
-        stripped = text.strip()
-        if not stripped:
-            return None
-
-        if not any(ch in stripped for ch in "*?[]"):
-            return f"*{stripped}*"
-
-        return stripped
-
     def get_filtered_parents(
         self,
         *,
@@ -94,13 +116,13 @@ class TabController:
             exclude_copy_on_change: Whether copy-on-change derived parents
                 should be hidden.
         """
-        pattern = self._normalize_glob_pattern(filter_text)
+        matches = compile_glob_matcher(filter_text)
         parents = self._data_source.get_sorted_parents(
             exclude_copy_on_change=exclude_copy_on_change
         )
-        if pattern is None:
+        if matches is None:
             return parents
-        return [p for p in parents if fnmatch.fnmatchcase(p, pattern)]
+        return [p for p in parents if matches(p)]
 
     def get_filtered_child_items(
         self,
@@ -117,36 +139,18 @@ class TabController:
             only_unused: When true, only children with zero expression
                 references are returned.
         """
-        pattern = self._normalize_glob_pattern(child_filter_text)
+        matches = compile_glob_matcher(child_filter_text)
         refs = self._data_source.get_child_refs(selected_parents)
-
-        counts = self._get_reference_counts(refs, only_unused=only_unused)
-        return [
-            ref
-            for ref in refs
-            if self._should_keep_ref(ref, pattern=pattern, only_unused=only_unused, counts=counts)
-        ]
-
-    def _get_reference_counts(
-        self, refs: list[ParentChildRef], *, only_unused: bool
-    ) -> dict[str, int]:
+        if matches is not None:
+            refs = [ref for ref in refs if matches(ref.child)]
         if not only_unused:
-            return {}
-        return self._data_source.get_expression_reference_counts([ref.text for ref in refs])
+            return refs
 
-    def _should_keep_ref(
-        self,
-        ref: ParentChildRef,
-        *,
-        pattern: str | None,
-        only_unused: bool,
-        counts: dict[str, int],
-    ) -> bool:
-        if pattern is not None and not fnmatch.fnmatchcase(ref.child, pattern):
-            return False
-        if not only_unused:
-            return True
-        return counts.get(ref.text, 0) == 0
+        # Count references only for refs that survived the name filter; the
+        # expression walk behind the counts is the expensive part.
+        texts = [ref.text for ref in refs]
+        get_count = self._data_source.get_expression_reference_counts(texts).get
+        return [ref for ref, text in zip(refs, texts, strict=True) if get_count(text, 0) == 0]
 
     def get_post_remove_unused_update(
         self,
@@ -14,7 +14,7 @@ from .expression_item import ExpressionItem
 from .parent_child_ref import ParentChildRef
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RemoveUnusedResult:
     """Outcome of a remove-unused operation.
 
@@ -31,7 +31,7 @@ class RemoveUnusedResult:
     failed: list[str]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PostRemoveUpdate:
     """UI update instructions after a remove-unused mutation.
 
@@ -47,7 +47,7 @@ class PostRemoveUpdate:
     clear_expressions: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RemoveUnusedAndUpdateResult:
     """Combined remove result and follow-up UI update."""
 
@@ -103,6 +103,8 @@ class TabDataSource(Protocol):
         """Remove the selected children if they are unused.
 
         Implementations must not remove items that still have expression
-        references.
+        references. They must also not recompute the document or refresh the
+        GUI per removed item; the panel controller does both once after the
+        whole batch, and only when something was removed.
         """
         raise NotImplementedError
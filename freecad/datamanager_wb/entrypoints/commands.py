@@ -19,6 +19,9 @@ if TYPE_CHECKING:
 
 GetMainPanel = Callable[[], "MainPanel"]
 
+_VARSETS_ICON = os.path.join(ICONPATH, "Varsets.svg")
+_ALIASES_ICON = os.path.join(ICONPATH, "Aliases.svg")
+
 
 class _VarsetManagementCommand:
     def __init__(self, get_main_panel: GetMainPanel) -> None:
@@ -33,7 +36,7 @@ class _VarsetManagementCommand:
         return {
             "MenuText": translate("Workbench", "Varset Management"),
             "ToolTip": translate("Workbench", "Manage VarSets"),
-            "Pixmap": os.path.join(ICONPATH, "Varsets.svg"),
+            "Pixmap": _VARSETS_ICON,
         }
 
     def IsActive(self) -> bool:
@@ -58,7 +61,7 @@ class _AliasManagementCommand:
         return {
             "MenuText": translate("Workbench", "Alias Management"),
             "ToolTip": translate("Workbench", "Manage Aliases"),
-            "Pixmap": os.path.join(ICONPATH, "Aliases.svg"),
+            "Pixmap": _ALIASES_ICON,
         }
 
     def IsActive(self) -> bool:
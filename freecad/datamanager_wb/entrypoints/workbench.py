@@ -9,6 +9,7 @@ and activate the workbench.
 
 import os
 
+from ..ports.document_observer import install_document_observer, uninstall_document_observer
 from ..ports.freecad_port import get_port
 from ..resources import ICONPATH
 
@@ -64,10 +65,16 @@ if Gui is not None:
             """
             code which should be computed when a user switch to this workbench
             """
+            import FreeCAD as App  # pylint: disable=import-error
+
+            install_document_observer(App)
             get_port().message(_translate("Log", "Workbench datamanager_wb activated. ;-)") + "\n")
 
         def Deactivated(self):
             """
             code which should be computed when this workbench is deactivated
             """
+            import FreeCAD as App  # pylint: disable=import-error
+
+            uninstall_document_observer(App)
             get_port().message(_translate("Log", "Workbench datamanager_wb de-activated.") + "\n")
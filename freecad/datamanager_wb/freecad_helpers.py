@@ -7,16 +7,61 @@ These helpers centralize small FreeCAD-facing operations (document access,
 object lookup, expression iteration, copy-on-change filtering) behind a narrow
 API. Most functions accept an optional `FreeCadContext` so they can be tested
 outside FreeCAD.
+
+Document-wide scans can be memoized with `cached_for_document`, which reuses a
+result until the document's revision (see `ports.document_observer`) changes.
+Lookups that are answered piecemeal can fill a `document_memo` instead.
 """
 
 from __future__ import annotations
 
-from collections.abc import Iterable, Iterator, Sequence
-from typing import cast
+import sys
+from collections.abc import Callable, Hashable, Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any, NamedTuple, TypeVar, cast
 
+from .ports.document_observer import get_document_revision
 from .ports.freecad_context import FreeCadContext
 from .ports.freecad_port import get_port
 
+_T = TypeVar("_T")
+
+_document_cache: dict[Hashable, tuple[int, object]] = {}
+
+
+def cached_for_document(doc: object, key: Hashable, compute: Callable[[], _T]) -> _T:
+    """Return `compute()`, reusing the previous result while `doc` is unchanged.
+
+    One result is kept per `key`; it is recomputed whenever the document
+    revision changes or another document is queried. When document changes are
+    not tracked, `compute()` is called every time.
+
+    Cached values are shared between callers and must be treated as read-only.
+    """
+    revision = get_document_revision(doc)
+    if revision is None:
+        return compute()
+    entry = _document_cache.get(key)
+    if entry is not None and entry[0] == revision:
+        return cast(_T, entry[1])
+    value = compute()
+    _document_cache[key] = (revision, value)
+    return value
+
+
+def document_memo(doc: object, key: Hashable) -> dict[Any, Any]:
+    """Return a mutable per-revision memo dict for `doc`.
+
+    Unlike `cached_for_document` values, the memo is meant to be filled in by its
+    owner: entries added during one document revision are kept until the
+    revision changes, then the memo starts out empty again. When document
+    changes are not tracked, a fresh dict is returned every time.
+
+    The memo is private to `key`'s owner; hand out copies of its entries, not
+    the entries themselves.
+    """
+    return cached_for_document(doc, ("memo", key), dict)
+
 
 def iter_document_objects(doc: object) -> Iterator[object]:
     """Yield non-null objects from a FreeCAD document's `Objects` list."""
@@ -51,27 +96,32 @@ def get_typed_object(doc: object, name: str, *, type_id: str) -> object | None:
 
 def build_expression_key(*, obj_name: str, lhs: object) -> str:
     """Build the canonical expression key string for a named expression entry."""
-    if str(lhs).startswith("."):
-        return f"{obj_name}{lhs}"
-    return f"{obj_name}.{lhs}"
+    text = lhs if isinstance(lhs, str) else str(lhs)
+    if text[:1] == ".":
+        return obj_name + text
+    return f"{obj_name}.{text}"
 
 
 def _iter_expression_engine(obj: object) -> Iterator[object]:
     expressions = getattr(obj, "ExpressionEngine", None)
-    if not expressions or not isinstance(expressions, Iterable):
+    if not expressions:
+        return
+    # `iter()` is a single slot check; `isinstance(..., Iterable)` goes through
+    # the ABC machinery for every object in the document.
+    try:
+        entries = iter(expressions)
+    except TypeError:
         return
-    yield from expressions
+    yield from entries
 
 
 def _try_parse_expression(expr: object) -> tuple[object, object] | None:
-    if not isinstance(expr, Sequence) or len(expr) < 2:
-        return None
+    # Entries are `(lhs, expression)` tuples; index them directly instead of
+    # checking against the `Sequence` ABC first.
     try:
-        lhs = expr[0]
-        expr_text = expr[1]
+        return expr[0], expr[1]  # type: ignore[index]
     except Exception:  # pylint: disable=broad-exception-caught
         return None
-    return lhs, expr_text
 
 
 def iter_expression_engine_entries(doc: object) -> Iterator[tuple[object, object, object]]:
@@ -85,40 +135,123 @@ def iter_expression_engine_entries(doc: object) -> Iterator[tuple[object, object
             yield obj, lhs, expr_text
 
 
-def iter_named_expression_engine_entries(doc: object) -> Iterator[tuple[str, object, object]]:
-    """Yield `(obj_name, lhs, expr_text)` tuples for expression engine entries."""
-    for obj, lhs, expr_text in iter_expression_engine_entries(doc):
+class NamedExpression(NamedTuple):
+    """One validated expression engine entry of a named document object.
+
+    Attributes:
+        obj_name: Internal name of the object owning the expression.
+        lhs: Bound property path (e.g. ``"Length"`` or ``".Placement.Base.x"``).
+        text: Expression text.
+    """
+
+    obj_name: str
+    lhs: str
+    text: str
+
+
+def iter_named_expression_engine_entries(doc: object) -> Sequence[NamedExpression]:
+    """Return the `(obj_name, lhs, text)` expression engine entries of a document.
+
+    All three fields are `str`, so callers can search them directly. The
+    memoized scan tuple is returned as-is, so callers loop over it without a
+    generator frame in between.
+    """
+    return get_document_scan(doc).named_expressions
+
+
+_COPY_ON_CHANGE_GROUP = "CopyOnChangeGroup"
+
+
+def _is_copy_on_change_named_group(obj: object) -> bool:
+    # FreeCAD labels are always strings; a missing or empty label becomes "".
+    label: str = getattr(obj, "Label", "") or ""
+    return label.startswith(_COPY_ON_CHANGE_GROUP)
+
+
+@dataclass(frozen=True, slots=True)
+class DocumentScan:
+    """Objects of one document, bucketed by what the workbench queries.
+
+    Attributes:
+        objects_by_type: Document objects grouped by `TypeId`.
+        copy_on_change_groups: Objects labelled as CopyOnChange groups.
+        named_expressions: Expression engine entries, validated and converted
+            to `str` once per scan.
+    """
+
+    objects_by_type: Mapping[str, tuple[object, ...]]
+    copy_on_change_groups: tuple[object, ...]
+    named_expressions: tuple[NamedExpression, ...]
+
+
+def _scan_document(doc: object) -> DocumentScan:
+    by_type: dict[str, list[object]] = {}
+    groups: list[object] = []
+    expressions: list[NamedExpression] = []
+    append_expression = expressions.append
+    intern = sys.intern
+    for obj in iter_document_objects(doc):
+        type_id = getattr(obj, "TypeId", None)
+        if isinstance(type_id, str):
+            by_type.setdefault(type_id, []).append(obj)
+        if _is_copy_on_change_named_group(obj):
+            groups.append(obj)
         obj_name = get_object_name(obj)
         if obj_name is None:
             continue
-        yield obj_name, lhs, expr_text
+        # Same parsing as `_try_parse_expression`, inlined: this runs once per
+        # expression in the document.
+        for expr in _iter_expression_engine(obj):
+            try:
+                lhs, expr_text = expr[0], expr[1]  # type: ignore[index]
+            except Exception:  # pylint: disable=broad-exception-caught
+                continue
+            # Property paths repeat across objects; share one string each.
+            append_expression(NamedExpression(obj_name, intern(str(lhs)), str(expr_text)))
+    return DocumentScan(
+        objects_by_type={type_id: tuple(objs) for type_id, objs in by_type.items()},
+        copy_on_change_groups=tuple(groups),
+        named_expressions=tuple(expressions),
+    )
+
+
+def get_document_scan(doc: object) -> DocumentScan:
+    """Return the document's objects bucketed by type, group label and expressions.
+
+    A single pass over `doc.Objects` serves the VarSet, spreadsheet,
+    copy-on-change and expression queries, and the result is memoized per
+    document revision (see `cached_for_document`).
+    """
+    return cached_for_document(doc, "document_scan", lambda: _scan_document(doc))
+
+
+def iter_document_objects_of_type(doc: object, type_id: str) -> Iterator[object]:
+    """Yield document objects whose `TypeId` equals `type_id`."""
+    yield from get_document_scan(doc).objects_by_type.get(type_id, ())
 
 
 def _get_direct_copy_on_change_group(doc: object) -> object | None:
     getter = getattr(doc, "getObject", None)
     if not callable(getter):
         return None
-    group = getter("CopyOnChangeGroup")
+    group = getter(_COPY_ON_CHANGE_GROUP)
     if group is None:
         return None
     return cast(object, group)
 
 
 def _iter_copy_on_change_named_groups(doc: object) -> Iterator[object]:
-    for obj in getattr(doc, "Objects", []) or []:
-        label = getattr(obj, "Label", None)
-        if isinstance(label, str) and label.startswith("CopyOnChangeGroup"):
-            yield cast(object, obj)
+    yield from get_document_scan(doc).copy_on_change_groups
 
 
 def get_copy_on_change_groups(doc: object) -> list[object]:
     """Return all CopyOnChange groups found in the given document."""
-    groups: list[object] = []
     direct = _get_direct_copy_on_change_group(doc)
-    if direct is not None:
-        groups.append(direct)
-    groups.extend(_iter_copy_on_change_named_groups(doc))
-    return groups
+    if direct is None:
+        return list(_iter_copy_on_change_named_groups(doc))
+    # The group named "CopyOnChangeGroup" is usually labelled that way too;
+    # seed the traversal with it only once.
+    return [direct, *(g for g in _iter_copy_on_change_named_groups(doc) if g is not direct)]
 
 
 def _iter_non_null(values: object) -> Iterator[object]:
@@ -137,27 +270,38 @@ def iter_object_children(obj: object) -> Iterator[object]:
     yield from _iter_non_null(getattr(obj, "OutList", None))
 
 
-def get_copy_on_change_names(*, doc: object, type_id: str) -> set[str]:
-    """Return object names of the given `type_id` under CopyOnChange groups."""
-    seen: set[int] = set()
-    names: set[str] = set()
+def get_copy_on_change_ids(*, doc: object, type_id: str) -> frozenset[int]:
+    """Return `id()`s of objects of the given `type_id` under CopyOnChange groups.
+
+    Identity is used instead of object names so callers can filter document
+    objects with an integer set lookup, without reading `Name` first. The
+    result is memoized per document revision, since every list refresh with
+    copy-on-change exclusion enabled asks for it again.
+    """
+    return cached_for_document(
+        doc,
+        ("copy_on_change_ids", type_id),
+        lambda: _collect_copy_on_change_ids(doc=doc, type_id=type_id),
+    )
 
-    def visit(o: object) -> None:
+
+def _collect_copy_on_change_ids(*, doc: object, type_id: str) -> frozenset[int]:
+    # Iterative depth-first walk: deep assemblies cannot hit the recursion
+    # limit, and no Python frame is created per visited node.
+    seen: set[int] = set()
+    found: set[int] = set()
+    stack = get_copy_on_change_groups(doc)
+    while stack:
+        o = stack.pop()
         oid = id(o)
         if oid in seen:
-            return
+            continue
         seen.add(oid)
 
         if getattr(o, "TypeId", None) == type_id:
-            name = get_object_name(o)
-            if name is not None:
-                names.add(name)
-            return
-
-        for child in iter_object_children(o):
-            visit(child)
+            found.add(oid)
+            continue
 
-    for group in get_copy_on_change_groups(doc):
-        visit(group)
+        stack.extend(iter_object_children(o))
 
-    return names
+    return frozenset(found)
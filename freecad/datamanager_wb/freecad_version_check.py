@@ -16,6 +16,13 @@ FC_MAJOR_VER_REQUIRED = 1
 FC_MINOR_VER_REQUIRED = 0
 FC_PATCH_VER_REQUIRED = 2
 FC_COMMIT_REQUIRED = 33772
+_PYTHON_VERSION_REQUIRED = (3, 11)
+_FC_VERSION_REQUIRED = (
+    FC_MAJOR_VER_REQUIRED,
+    FC_MINOR_VER_REQUIRED,
+    FC_PATCH_VER_REQUIRED,
+    FC_COMMIT_REQUIRED,
+)
 
 
 def _warn_unsupported_python_version() -> None:
@@ -44,7 +51,8 @@ def _parse_freecad_version() -> tuple[int, int, int, int]:
     minor_ver = int(ver[1])
     patch_ver = int(ver[2])
 
-    parts = str(ver[3]).split()
+    # The fourth field looks like "33772 (Git)"; only the leading number matters.
+    parts = str(ver[3]).split(maxsplit=1)
     gitver_str = parts[0] if parts else ""
     gitver = _coerce_gitver(gitver_str)
     return major_ver, minor_ver, patch_ver, gitver
@@ -88,12 +96,7 @@ def check_supported_python_version(
         ``True`` if the version is supported, otherwise ``False``.
     """
 
-    return (major_ver, minor_ver, patch_ver, git_ver) >= (
-        FC_MAJOR_VER_REQUIRED,
-        FC_MINOR_VER_REQUIRED,
-        FC_PATCH_VER_REQUIRED,
-        FC_COMMIT_REQUIRED,
-    )
+    return (major_ver, minor_ver, patch_ver, git_ver) >= _FC_VERSION_REQUIRED
 
 
 def check_python_and_freecad_version() -> None:
@@ -110,7 +113,7 @@ def check_python_and_freecad_version() -> None:
     functionality.
     """
 
-    if not (sys.version_info[0] == 3 and sys.version_info[1] >= 11):
+    if sys.version_info < _PYTHON_VERSION_REQUIRED:
         _warn_unsupported_python_version()
         return
 
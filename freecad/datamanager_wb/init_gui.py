@@ -15,11 +15,17 @@ if Gui is not None:
     from .entrypoints.workbench import DataManagerWorkbench
     from .freecad_version_check import check_python_and_freecad_version
     from .resources import TRANSLATIONSPATH
-    from .ui.main_panel import get_main_panel
+
+    def _get_main_panel():
+        # The panel module pulls in the PySide widgets and the whole UI layer;
+        # import it when a command is first activated rather than at startup.
+        from .ui.main_panel import get_main_panel
+
+        return get_main_panel()
 
     Gui.addLanguagePath(TRANSLATIONSPATH)
     Gui.updateLocale()
 
     check_python_and_freecad_version()
-    register_commands(get_main_panel)
+    register_commands(_get_main_panel)
     Gui.addWorkbench(DataManagerWorkbench())
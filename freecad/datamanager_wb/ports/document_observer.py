@@ -0,0 +1,148 @@
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# SPDX-FileNotice: Part of the DataManager addon.
+
+"""Document change tracking for FreeCAD documents.
+
+This module provides a small FreeCAD document observer that assigns a new
+revision number to a document whenever one of its objects is created, deleted,
+or changed. Query helpers use the revision as a cache token so repeated UI
+refreshes can reuse document scans until the document actually changes.
+
+When no observer is installed (e.g. in unit tests), no revision is available and
+callers must not cache anything.
+"""
+
+from __future__ import annotations
+
+import itertools
+
+# Shared by every observer instance, so re-installing the observer (e.g. after the
+# workbench was deactivated) never hands out a revision that is already cached.
+_revision_counter = itertools.count(1)
+
+
+class DocumentRevisionObserver:
+    """FreeCAD document observer that tracks a revision number per document.
+
+    FreeCAD calls the `slot*` methods of registered observers by name. Every
+    relevant notification stamps the affected document with a new value from a
+    process-wide counter, so revisions never repeat even if a document is
+    closed and another one is opened under the same name.
+    """
+
+    def __init__(self) -> None:
+        self._counter = _revision_counter
+        self._revisions: dict[int, int] = {}
+
+    def revision(self, doc: object) -> int:
+        """Return the current revision of a document, stamping it on first use."""
+        key = id(doc)
+        revision = self._revisions.get(key)
+        if revision is None:
+            revision = self._revisions[key] = next(self._counter)
+        return revision
+
+    def _bump(self, doc: object | None) -> None:
+        if doc is not None:
+            self._revisions[id(doc)] = next(self._counter)
+
+    def _bump_owner(self, obj: object) -> None:
+        self._bump(getattr(obj, "Document", None))
+
+    def slotCreatedDocument(self, doc: object) -> None:  # noqa: N802
+        """Start tracking a newly created or opened document."""
+        self._bump(doc)
+
+    def slotDeletedDocument(self, doc: object) -> None:  # noqa: N802
+        """Forget a closed document."""
+        self._revisions.pop(id(doc), None)
+
+    def slotRelabelDocument(self, doc: object) -> None:  # noqa: N802
+        """Invalidate a document whose label changed."""
+        self._bump(doc)
+
+    def slotUndoDocument(self, doc: object) -> None:  # noqa: N802
+        """Invalidate a document after an undo step."""
+        self._bump(doc)
+
+    def slotRedoDocument(self, doc: object) -> None:  # noqa: N802
+        """Invalidate a document after a redo step."""
+        self._bump(doc)
+
+    def slotCreatedObject(self, obj: object) -> None:  # noqa: N802
+        """Invalidate the document owning a newly created object."""
+        self._bump_owner(obj)
+
+    def slotDeletedObject(self, obj: object) -> None:  # noqa: N802
+        """Invalidate the document owning a deleted object."""
+        self._bump_owner(obj)
+
+    def slotChangedObject(self, obj: object, _prop: str) -> None:  # noqa: N802
+        """Invalidate the document owning a changed object."""
+        self._bump_owner(obj)
+
+    def slotAppendDynamicProperty(self, obj: object, _prop: str) -> None:  # noqa: N802
+        """Invalidate the document when a property (e.g. a VarSet variable) is added."""
+        self._bump_owner(obj)
+
+    def slotRemoveDynamicProperty(self, obj: object, _prop: str) -> None:  # noqa: N802
+        """Invalidate the document when a property (e.g. a VarSet variable) is removed."""
+        self._bump_owner(obj)
+
+
+_observer: DocumentRevisionObserver | None = None
+
+
+def install_document_observer(app: object) -> bool:
+    """Register the process-wide revision observer with FreeCAD, once.
+
+    Args:
+        app: The FreeCAD application module (or a test double).
+
+    Returns:
+        ``True`` when an observer is installed, ``False`` when `app` does not
+        support document observers.
+    """
+    global _observer  # pylint: disable=global-statement
+    if _observer is not None:
+        return True
+    add_observer = getattr(app, "addDocumentObserver", None)
+    if not callable(add_observer):
+        return False
+    observer = DocumentRevisionObserver()
+    try:
+        add_observer(observer)
+    except Exception:  # pylint: disable=broad-exception-caught
+        return False
+    _observer = observer
+    return True
+
+
+def uninstall_document_observer(app: object) -> None:
+    """Unregister the revision observer installed by `install_document_observer`.
+
+    Afterwards no revisions are available, so cached document scans are no
+    longer reused until the observer is installed again.
+
+    Args:
+        app: The FreeCAD application module (or a test double).
+    """
+    global _observer  # pylint: disable=global-statement
+    observer = _observer
+    if observer is None:
+        return
+    _observer = None
+    remove_observer = getattr(app, "removeDocumentObserver", None)
+    if not callable(remove_observer):
+        return
+    try:
+        remove_observer(observer)
+    except Exception:  # pylint: disable=broad-exception-caught
+        return
+
+
+def get_document_revision(doc: object) -> int | None:
+    """Return the document's revision, or ``None`` when changes are not tracked."""
+    if _observer is None:
+        return None
+    return _observer.revision(doc)
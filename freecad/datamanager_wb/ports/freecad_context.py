@@ -56,7 +56,7 @@ class GuiLike(Protocol):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FreeCadContext:
     """Bundle of runtime bindings used by this workbench.
 
@@ -61,7 +61,7 @@ class FreeCadPort(Protocol):
         """
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FreeCadContextAdapter:
     """Runtime adapter that implements :class:`FreeCadPort` using `FreeCadContext`."""
 
@@ -182,12 +182,19 @@ class FreeCadContextAdapter:
             pass
 
 
+_runtime_port: FreeCadPort | None = None
+
+
 def get_port(ctx: FreeCadContext | None = None) -> FreeCadPort:
     """Return a :class:`FreeCadPort` backed by the given context.
 
     When `ctx` is not provided, this function obtains the real FreeCAD runtime
-    context via :func:`get_runtime_context`.
+    context via :func:`get_runtime_context`. The runtime modules never change
+    within a session, so that port is built once and reused.
     """
-    if ctx is None:
-        ctx = get_runtime_context()
-    return FreeCadContextAdapter(ctx)
+    if ctx is not None:
+        return FreeCadContextAdapter(ctx)
+    global _runtime_port  # pylint: disable=global-statement
+    if _runtime_port is None:
+        _runtime_port = FreeCadContextAdapter(get_runtime_context())
+    return _runtime_port
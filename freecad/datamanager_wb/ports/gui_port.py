@@ -3,12 +3,14 @@
 
 """GUI port abstraction for FreeCADGui-dependent behavior.
 
-This module isolates FreeCADGui/PySideUic access behind a small interface so the
+This module isolates FreeCADGui/Qt UI loading access behind a small interface so the
 UI layer can be tested without importing FreeCADGui.
 """
 
 from __future__ import annotations
 
+import functools
+from pathlib import Path
 from typing import Protocol, cast
 
 
@@ -40,14 +42,33 @@ class GuiPort(Protocol):
         """Add a widget as a subwindow under the given MDI area."""
 
 
+@functools.lru_cache(maxsize=8)
+def _read_ui_bytes(ui_path: str) -> bytes:
+    # The .ui files ship with the workbench and never change at runtime, so the
+    # panel can be rebuilt (after its subwindow is closed) without touching disk.
+    return Path(ui_path).read_bytes()
+
+
 class FreeCadGuiAdapter:
     """Runtime implementation of `GuiPort` using FreeCADGui."""
 
     def load_ui(self, ui_path: str) -> object:  # noqa: ANN401
-        """Load a Qt Designer .ui file via FreeCADGui."""
-        import FreeCADGui as Gui  # pylint: disable=import-error
-
-        return Gui.PySideUic.loadUi(ui_path)
+        """Load a Qt Designer .ui file with `QUiLoader` from cached file contents.
+
+        The workbench forms only use stock Qt widgets, so `QUiLoader` builds the
+        same widget tree as `FreeCADGui.PySideUic.loadUi` while the file itself is
+        read from disk only once per session.
+        """
+        from PySide.QtCore import QBuffer, QByteArray, QIODevice
+        from PySide.QtUiTools import QUiLoader
+
+        buffer = QBuffer()
+        buffer.setData(QByteArray(_read_ui_bytes(ui_path)))
+        buffer.open(QIODevice.ReadOnly)
+        try:
+            return QUiLoader().load(buffer)
+        finally:
+            buffer.close()
 
     def get_main_window(self) -> object:  # noqa: ANN401
         """Return the FreeCAD main window via FreeCADGui."""
@@ -31,11 +31,18 @@ class QtSettingsAdapter:
     def __init__(self, *, group: str, app: str) -> None:
         self._group = group
         self._app = app
+        self._settings: QtCore.QSettings | None = None
 
     def _get_settings(self) -> QtCore.QSettings:
-        from PySide import QtCore
-
-        return QtCore.QSettings(self._group, self._app)
+        # Keep one QSettings for the adapter's lifetime. A fresh instance per call
+        # re-reads the backing store and flushes it again when it is destroyed;
+        # a long-lived one buffers writes (e.g. per splitterMoved tick) in memory
+        # and lets Qt sync them to disk in the background.
+        if self._settings is None:
+            from PySide import QtCore
+
+            self._settings = QtCore.QSettings(self._group, self._app)
+        return self._settings
 
     def value(self, key: str, default: object | None = None) -> object | None:
         """Return a stored value from Qt settings."""
@@ -6,8 +6,11 @@
 Adapts spreadsheet alias queries/mutations to the generic `TabController`.
 """
 
-from ..domain.expression_item import ExpressionItem
-from ..domain.parent_child_ref import ParentChildRef, parse_parent_child_ref
+import sys
+from collections.abc import Iterator
+
+from ..domain.expression_item import ExpressionItem, by_display_text
+from ..domain.parent_child_ref import ParentChildRef, by_text, parse_parent_child_ref
 from ..domain.tab_datasource import RemoveUnusedResult, TabDataSource
 from ..ports.freecad_context import FreeCadContext
 from .spreadsheet_mutations import removeSpreadsheetAlias
@@ -61,11 +64,15 @@ class SpreadsheetDataSource(TabDataSource):
 
     def get_child_refs(self, selected_parents: list[str]) -> list[ParentChildRef]:
         """Return alias refs for the selected spreadsheets."""
+        intern = sys.intern
         items: list[ParentChildRef] = []
         for sheet_name in selected_parents:
-            for alias_name in getSpreadsheetAliasNames(sheet_name, ctx=self._ctx):
-                items.append(ParentChildRef(parent=sheet_name, child=alias_name))
-        items.sort(key=lambda ref: ref.text)
+            parent = intern(sheet_name)
+            items.extend(
+                ParentChildRef(parent=parent, child=intern(alias_name))
+                for alias_name in getSpreadsheetAliasNames(sheet_name, ctx=self._ctx)
+            )
+        items.sort(key=by_text)
         return items
 
     def get_expression_items(
@@ -74,15 +81,15 @@ class SpreadsheetDataSource(TabDataSource):
         """Return expression items referencing the selected aliases."""
         counts: dict[str, int] = {}
         expression_items: list[ExpressionItem] = []
-        for ref in _normalize_alias_refs(selected_children):
+        for ref in _iter_alias_refs(selected_children):
             refs = getSpreadsheetAliasReferences(ref.parent, ref.child, ctx=self._ctx)
-            counts[ref.text] = len(refs)
-            for lhs, rhs in refs.items():
-                expression_items.append(
-                    _to_expression_item(parent=ref.parent, alias=ref.child, lhs=lhs, rhs=rhs)
-                )
+            counts[sys.intern(ref.text)] = len(refs)
+            expression_items.extend(
+                _to_expression_item(parent=ref.parent, alias=ref.child, lhs=lhs, rhs=rhs)
+                for lhs, rhs in refs.items()
+            )
 
-        expression_items.sort(key=lambda item: item.display_text)
+        expression_items.sort(key=by_display_text)
         return expression_items, counts
 
     def get_expression_reference_counts(
@@ -90,9 +97,9 @@ class SpreadsheetDataSource(TabDataSource):
     ) -> dict[str, int]:
         """Return expression reference counts for the selected aliases."""
         counts: dict[str, int] = {}
-        for ref in _normalize_alias_refs(selected_children):
+        for ref in _iter_alias_refs(selected_children):
             refs = getSpreadsheetAliasReferences(ref.parent, ref.child, ctx=self._ctx)
-            counts[ref.text] = len(refs)
+            counts[sys.intern(ref.text)] = len(refs)
         return counts
 
     def remove_unused_children(
@@ -103,7 +110,7 @@ class SpreadsheetDataSource(TabDataSource):
         still_used: list[str] = []
         failed: list[str] = []
 
-        for ref in _normalize_alias_refs(selected_children):
+        for ref in _iter_alias_refs(selected_children):
             refs = getSpreadsheetAliasReferences(ref.parent, ref.child, ctx=self._ctx)
             if refs:
                 still_used.append(ref.text)
@@ -118,13 +125,11 @@ class SpreadsheetDataSource(TabDataSource):
         return RemoveUnusedResult(removed=removed, still_used=still_used, failed=failed)
 
 
-def _normalize_alias_refs(items: list[ParentChildRef] | list[str]) -> list[ParentChildRef]:
-    normalized: list[ParentChildRef] = []
+def _iter_alias_refs(items: list[ParentChildRef] | list[str]) -> Iterator[ParentChildRef]:
     for item in items:
         if isinstance(item, ParentChildRef):
-            normalized.append(item)
+            yield item
         else:
             parsed = parse_parent_child_ref(item)
             if parsed is not None:
-                normalized.append(parsed)
-    return normalized
+                yield parsed
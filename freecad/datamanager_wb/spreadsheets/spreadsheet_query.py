@@ -7,20 +7,32 @@ Provides discovery of spreadsheet objects, enumeration of alias names, and
 searching expressions for alias references.
 """
 
+import functools
 import re
-from collections.abc import Iterable, Iterator, Mapping
+import string
+from collections.abc import Callable, Iterable, Iterator, Mapping
 
 from ..freecad_helpers import (
+    NamedExpression,
     build_expression_key,
-    get_copy_on_change_names,
+    cached_for_document,
+    get_copy_on_change_ids,
     get_object_name,
-    iter_document_objects,
+    iter_document_objects_of_type,
     iter_named_expression_engine_entries,
 )
 from ..ports.freecad_context import FreeCadContext
 from ..ports.freecad_port import get_port
 
 _CELL_RE = re.compile(r"^[A-Z]+[0-9]+$")
+# Same pattern applied per line; lets one findall() classify a whole batch of
+# newline-joined names (aliases and cell addresses never contain newlines).
+_CELL_LINES_RE = re.compile(r"^[A-Z]+[0-9]+$", re.MULTILINE)
+_COLUMN_LABELS: tuple[str, ...] = tuple(string.ascii_uppercase) + tuple(
+    a + b for a in string.ascii_uppercase for b in string.ascii_uppercase
+)
+_SCAN_MAX_ROWS = 200
+_SCAN_MAX_COLS = 52
 
 
 def _coerce_mapping(value: object) -> dict[str, str]:
@@ -31,30 +43,41 @@ def _coerce_mapping(value: object) -> dict[str, str]:
     return {}
 
 
-def _count_cell_like(values: object) -> int:
-    if not isinstance(values, (list, tuple, set)):
-        return 0
-    return sum(1 for v in values if _CELL_RE.match(str(v or "")))
+def _count_cell_like(values: Iterable[str]) -> int:
+    return len(_CELL_LINES_RE.findall("\n".join(values)))
+
+
+def _has_at_least_cell_like(values: Iterable[str], *, count: int) -> bool:
+    if count <= 0:
+        return True
+    match = _CELL_RE.match
+    found = 0
+    for v in values:
+        if match(v):
+            found += 1
+            if found >= count:
+                return True
+    return False
 
 
 def _normalize_alias_map(raw: dict[str, str]) -> dict[str, str]:
     if not raw:
         return {}
 
-    key_cells = _count_cell_like(list(raw.keys()))
-    val_cells = _count_cell_like(list(raw.values()))
-    if key_cells > val_cells:
-        return {alias: cell for cell, alias in raw.items()}
-    return raw
+    # Invert when the keys look more like cell addresses than the values. The
+    # value scan stops as soon as the values are known to match at least as
+    # many cells as the keys.
+    key_cells = _count_cell_like(raw)
+    if _has_at_least_cell_like(raw.values(), count=key_cells):
+        return raw
+    return {alias: cell for cell, alias in raw.items()}
 
 
 def _iter_cell_coordinates(*, max_rows: int, max_cols: int) -> Iterator[str]:
-    cols = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
-    for col_idx in range(max_cols):
-        a = cols[col_idx % 26]
-        prefix = a if col_idx < 26 else f"{cols[(col_idx // 26) - 1]}{a}"
-        for row in range(1, max_rows + 1):
-            yield f"{prefix}{row}"
+    rows = [str(row) for row in range(1, max_rows + 1)]
+    for col in _COLUMN_LABELS[:max_cols]:
+        for row in rows:
+            yield col + row
 
 
 def _try_call_cell_getter(sheet_obj: object, *, getter_name: str, cell: str) -> str | None:
@@ -78,16 +101,26 @@ def _try_get_cell_text(sheet_obj: object, cell: str) -> str | None:
 
 
 def _iter_nonempty_cell_texts(sheet: object) -> Iterator[tuple[str, str]]:
-    for cell in _iter_candidate_cells(sheet):
-        text = _try_get_cell_text(sheet, cell)
-        if text:
-            yield cell, text
+    yield from _iter_nonempty_cell_values(sheet, functools.partial(_try_get_cell_text, sheet))
+
+
+def _get_cached_cell_texts(sheet: object) -> tuple[tuple[str, str], ...]:
+    # Checking an alias for internal references reads every cell (one FreeCAD
+    # call each); the Aliases tab checks many aliases of the same sheet, so read
+    # the cells once per document change instead of once per alias.
+    doc = getattr(sheet, "Document", None)
+    name = get_object_name(sheet)
+    if doc is None or name is None:
+        return tuple(_iter_nonempty_cell_texts(sheet))
+    return cached_for_document(
+        doc, ("spreadsheet_cell_texts", name), lambda: tuple(_iter_nonempty_cell_texts(sheet))
+    )
 
 
 def _iter_alias_referenced_cells(
     sheet: object, *, alias_re: re.Pattern[str]
 ) -> Iterator[tuple[str, str]]:
-    for cell, text in _iter_nonempty_cell_texts(sheet):
+    for cell, text in _get_cached_cell_texts(sheet):
         if alias_re.search(text) is not None:
             yield cell, text
 
@@ -111,10 +144,9 @@ def _iter_cell_aliases(spreadsheet: object) -> Iterator[tuple[str, str]]:
     getter_one = getattr(spreadsheet, "getAlias", None)
     if not callable(getter_one):
         return
-    for cell in _iter_candidate_cells(spreadsheet):
-        alias = _try_get_alias(getter_one, cell)
-        if alias is not None:
-            yield str(cell), alias
+    yield from _iter_nonempty_cell_values(
+        spreadsheet, functools.partial(_try_get_alias, getter_one)
+    )
 
 
 def _try_get_alias(getter_one: object, cell: str) -> str | None:
@@ -142,19 +174,20 @@ def _try_resolve_cell_from_alias(spreadsheet: object, alias: str) -> str | None:
     return None
 
 
+@functools.lru_cache(maxsize=256)
 def _build_alias_search(
     *,
     label_or_name: str,
     alias_name: str | None,
-) -> tuple[list[str], re.Pattern[str] | None]:
-    patterns: list[str] = [f"<<{label_or_name}>>"]
+) -> tuple[tuple[str, ...], re.Pattern[str] | None]:
+    patterns: tuple[str, ...] = (f"<<{label_or_name}>>",)
     if not alias_name:
         return patterns, None
 
-    patterns = [
+    patterns = (
         f"<<{label_or_name}>>.{alias_name}",
         f"{label_or_name}.{alias_name}",
-    ]
+    )
     alias_re = re.compile(rf"(?<![A-Za-z0-9_]){re.escape(alias_name)}(?![A-Za-z0-9_])")
     return patterns, alias_re
 
@@ -162,12 +195,14 @@ def _build_alias_search(
 def _matches_expression(
     *,
     expr_text: object,
-    patterns: list[str],
+    patterns: tuple[str, ...],
     alias_re: re.Pattern[str] | None,
 ) -> bool:
-    text = str(expr_text)
-    if any(p in text for p in patterns):
-        return True
+    text = expr_text if isinstance(expr_text, str) else str(expr_text)
+    # At most two literals: plain `in` tests beat a generator or a regex here.
+    for pattern in patterns:
+        if pattern in text:
+            return True
     if alias_re is None:
         return False
     return alias_re.search(text) is not None
@@ -192,17 +227,36 @@ def _sheet_label_or_name(sheet: object) -> str:
     return str(label_value)
 
 
+def _get_expressions_mentioning(doc: object, label_or_name: str) -> tuple[NamedExpression, ...]:
+    return tuple(
+        entry for entry in iter_named_expression_engine_entries(doc) if label_or_name in entry[2]
+    )
+
+
+def _get_cached_expressions_mentioning(
+    doc: object, label_or_name: str
+) -> tuple[NamedExpression, ...]:
+    # Every search pattern contains the sheet's label, so the entries that do not
+    # mention it can never match; filter them out once per sheet and document
+    # revision, and let each alias search only scan the remainder.
+    return cached_for_document(
+        doc,
+        ("spreadsheet_expressions", label_or_name),
+        lambda: _get_expressions_mentioning(doc, label_or_name),
+    )
+
+
 def _collect_expression_engine_refs(
     *,
-    doc: object,
-    patterns: list[str],
-    alias_re: re.Pattern[str] | None,
+    entries: Iterable[NamedExpression],
+    patterns: tuple[str, ...],
 ) -> dict[str, str]:
+    matches = _matches_expression
     results: dict[str, str] = {}
-    for obj_name, lhs, expr_text in iter_named_expression_engine_entries(doc):
-        key = build_expression_key(obj_name=obj_name, lhs=lhs)
-        if _matches_expression(expr_text=expr_text, patterns=patterns, alias_re=alias_re):
-            results[key] = str(expr_text)
+    for obj_name, lhs, text in entries:
+        # Build the result key only for the few entries that match.
+        if matches(expr_text=text, patterns=patterns, alias_re=None):
+            results[build_expression_key(obj_name=obj_name, lhs=lhs)] = text
     return results
 
 
@@ -221,7 +275,13 @@ def _scan_aliases_via_cell_from_alias(spreadsheet: object) -> dict[str, str]:
     return aliases
 
 
-def _get_alias_map(spreadsheet: object) -> dict[str, str]:
+def get_alias_map(spreadsheet: object) -> dict[str, str]:
+    """Return the spreadsheet's aliases as an ``alias -> cell`` mapping.
+
+    Tries `getAliases()`, the `Alias`/`Aliases` properties, and finally a
+    per-cell `getAlias()` scan, normalizing the orientation of the mapping.
+    The result is always freshly read from the sheet.
+    """
     for getter in (
         _alias_map_from_getAliases,
         _alias_map_from_properties,
@@ -234,6 +294,18 @@ def _get_alias_map(spreadsheet: object) -> dict[str, str]:
     return {}
 
 
+def _get_cached_alias_map(spreadsheet: object) -> dict[str, str]:
+    # Sheets without getAliases() fall back to one getAlias() call per cell, so
+    # keep the map until the document changes. The result is shared: read only.
+    doc = getattr(spreadsheet, "Document", None)
+    name = get_object_name(spreadsheet)
+    if doc is None or name is None:
+        return get_alias_map(spreadsheet)
+    return cached_for_document(
+        doc, ("spreadsheet_alias_map", name), lambda: get_alias_map(spreadsheet)
+    )
+
+
 def _alias_map_from_getAliases(spreadsheet: object) -> dict[str, str]:
     getter = getattr(spreadsheet, "getAliases", None)
     if not callable(getter):
@@ -252,30 +324,18 @@ def _alias_map_from_properties(spreadsheet: object) -> dict[str, str]:
 
 
 def _iter_sheet_objects(doc: object) -> Iterator[object]:
-    for obj in iter_document_objects(doc):
-        if getattr(obj, "TypeId", None) == "Spreadsheet::Sheet":
-            yield obj
+    yield from iter_document_objects_of_type(doc, "Spreadsheet::Sheet")
 
 
-def _iter_sheet_names(doc: object) -> Iterator[str]:
+def _iter_filtered_sheet_names(*, doc: object, excluded: frozenset[int]) -> Iterator[str]:
     for obj in _iter_sheet_objects(doc):
+        if id(obj) in excluded:
+            continue
         name = get_object_name(obj)
         if name is not None:
             yield name
 
 
-def _iter_filtered_sheet_names(
-    *,
-    doc: object,
-    excluded: set[str],
-    exclude_copy_on_change: bool,
-) -> Iterator[str]:
-    for name in _iter_sheet_names(doc):
-        if exclude_copy_on_change and name in excluded:
-            continue
-        yield name
-
-
 def getSpreadsheets(
     *,
     exclude_copy_on_change: bool = False,
@@ -294,16 +354,12 @@ def getSpreadsheets(
     if doc is None:
         return
 
-    excluded: set[str] = (
-        get_copy_on_change_names(doc=doc, type_id="Spreadsheet::Sheet")
+    excluded: frozenset[int] = (
+        get_copy_on_change_ids(doc=doc, type_id="Spreadsheet::Sheet")
         if exclude_copy_on_change
-        else set()
-    )
-    yield from _iter_filtered_sheet_names(
-        doc=doc,
-        excluded=excluded,
-        exclude_copy_on_change=exclude_copy_on_change,
+        else frozenset()
     )
+    yield from _iter_filtered_sheet_names(doc=doc, excluded=excluded)
 
 
 def _try_get_cells_via_attr(spreadsheet: object, *, attr: str) -> list[str] | None:
@@ -333,12 +389,25 @@ def _get_candidate_cells_from_api(spreadsheet: object) -> list[str] | None:
     return None
 
 
-def _iter_candidate_cells(spreadsheet: object) -> Iterator[str]:
+def _iter_nonempty_cell_values(
+    spreadsheet: object, read_cell: Callable[[str], str | None]
+) -> Iterator[tuple[str, str]]:
     cells = _get_candidate_cells_from_api(spreadsheet)
     if cells is not None:
-        yield from cells
+        for cell in cells:
+            value = read_cell(cell)
+            if value:
+                yield cell, value
         return
-    yield from _iter_cell_coordinates(max_rows=200, max_cols=52)
+
+    # No used-cells API: probe every coordinate with the caller's single getter.
+    # The scan is not cut short on empty runs; sparse sheets would lose aliases
+    # and references, and remove-unused could then delete aliases still in use.
+    # Callers keep the results per document revision, so this runs once per change.
+    for cell in _iter_cell_coordinates(max_rows=_SCAN_MAX_ROWS, max_cols=_SCAN_MAX_COLS):
+        value = read_cell(cell)
+        if value:
+            yield cell, value
 
 
 def getSpreadsheetAliasNames(
@@ -363,8 +432,7 @@ def getSpreadsheetAliasNames(
     if sheet is None:
         return []
 
-    names = sorted(_get_alias_map(sheet).keys())
-    return names
+    return sorted(_get_cached_alias_map(sheet))
 
 
 def getSpreadsheetAliasReferences(
@@ -401,9 +469,13 @@ def getSpreadsheetAliasReferences(
     if alias_name is not None:
         _add_internal_alias_refs(sheet=sheet, alias_re=alias_re, results=results)
 
-    engine_alias_re = None if alias_name is not None else alias_re
+    # Expression engine entries are matched on the qualified patterns only, all
+    # of which contain the sheet label.
     results.update(
-        _collect_expression_engine_refs(doc=doc, patterns=patterns, alias_re=engine_alias_re)
+        _collect_expression_engine_refs(
+            entries=_get_cached_expressions_mentioning(doc, label_or_name),
+            patterns=patterns,
+        )
     )
 
     return results
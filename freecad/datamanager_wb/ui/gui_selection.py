@@ -13,7 +13,7 @@ they can be tested (or at least imported) outside FreeCAD.
 from ..domain.expression_item import ExpressionItem
 from ..domain.parsing_helpers import parse_expression_item_object_name
 from ..ports.freecad_context import FreeCadContext
-from ..ports.freecad_port import get_port
+from ..ports.freecad_port import FreeCadPort, get_port
 
 
 def _resolve_object_name(expression_item: ExpressionItem | str) -> str | None:
@@ -22,16 +22,17 @@ def _resolve_object_name(expression_item: ExpressionItem | str) -> str | None:
     return parse_expression_item_object_name(expression_item)
 
 
-def _get_active_doc_and_object(
-    *, obj_name: str, ctx: FreeCadContext | None
-) -> tuple[object, object] | None:
-    port = get_port(ctx)
+def _get_active_doc_and_object(*, obj_name: str, port: FreeCadPort) -> tuple[object, object] | None:
     doc = port.get_active_document()
     if doc is None:
         return None
     obj = port.get_object(doc, obj_name)
     if obj is None:
-        port.warn(port.translate("Log", f"Workbench MainPanel: cannot find object '{obj_name}'\n"))
+        # Translate the fixed template, not the formatted message: the catalog
+        # can only contain the template, and lupdate can only extract a literal.
+        port.warn(
+            port.translate("Log", "Workbench MainPanel: cannot find object '{}'\n").format(obj_name)
+        )
         return None
     return doc, obj
 
@@ -68,7 +69,7 @@ def select_object_from_expression_item(
         return
 
     port = get_port(ctx)
-    doc_and_obj = _get_active_doc_and_object(obj_name=obj_name, ctx=ctx)
+    doc_and_obj = _get_active_doc_and_object(obj_name=obj_name, port=port)
     if doc_and_obj is None:
         return
 
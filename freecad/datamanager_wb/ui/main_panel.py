@@ -7,9 +7,11 @@ Loads the `.ui` file, finds widgets, wires signals, and delegates operations to
 `PanelController`.
 """
 
+import contextlib
 import functools
 import os
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from collections.abc import Set as AbstractSet
 
 from PySide import QtCore, QtWidgets
 
@@ -19,7 +21,7 @@ from ..ports.app_port import AppPort, FreeCadAppAdapter
 from ..ports.gui_port import FreeCadGuiAdapter, GuiPort
 from ..ports.settings_port import QtSettingsAdapter, SettingsPort
 from ..resources import UIPATH
-from .main_panel_presenter import MainPanelPresenter
+from .main_panel_presenter import MainPanelPresenter, ParentListState
 from .panel_controller import PanelController
 
 _SETTINGS_GROUP = "DataManager"
@@ -30,6 +32,17 @@ _SETTING_VARSETS_SPLITTER_STATE = "varsets/splitter_state"
 _SETTING_ALIASES_SPLITTER_STATE = "aliases/splitter_state"
 _DISPLAY_MODE_NAME = "name"
 _DISPLAY_MODE_LABEL = "label"
+_FILTER_DEBOUNCE_MS = 180
+_ALIASES_TAB_INDEX = 1
+
+
+@contextlib.contextmanager
+def _signals_blocked(widget: QtCore.QObject) -> Iterator[None]:
+    previous = widget.blockSignals(True)
+    try:
+        yield
+    finally:
+        widget.blockSignals(previous)
 
 
 @functools.lru_cache(maxsize=1)
@@ -77,6 +90,9 @@ class MainPanel(QtWidgets.QDialog):
         self._copy_map: dict[QtWidgets.QListWidget, QtWidgets.QAbstractButton] = {}
         self._active_doc_name: str | None = None
         self._active_doc_timer: QtCore.QTimer | None = None
+        self._named_widgets: dict[str, QtCore.QObject] = {}
+        self._spreadsheets_stale = False
+        self._rendered_parent_states: dict[QtWidgets.QListWidget, ParentListState] = {}
 
         self.form = self._load_ui()
         self._widget = self._resolve_root_widget()
@@ -84,7 +100,7 @@ class MainPanel(QtWidgets.QDialog):
         self._find_widgets()
         self._configure_widgets()
         self._populate_varsets()
-        self._populate_spreadsheets()
+        self._populate_spreadsheets_when_visible()
         self._connect_signals()
         self._start_active_document_watch()
 
@@ -104,6 +120,7 @@ class MainPanel(QtWidgets.QDialog):
         self._active_doc_timer.deleteLater()
         self._active_doc_timer = None
 
+    @QtCore.Slot()
     def _check_active_document_changed(self) -> None:
         name = self._controller.get_active_document_name()
         if name is None and self._active_doc_name is not None:
@@ -135,7 +152,7 @@ class MainPanel(QtWidgets.QDialog):
     def _apply_active_document_change_plan_repopulate(self, plan) -> None:
         repopulate_steps: list[tuple[bool, object]] = [
             (plan.repopulate_varsets, self._populate_varsets),
-            (plan.repopulate_spreadsheets, self._populate_spreadsheets),
+            (plan.repopulate_spreadsheets, self._populate_spreadsheets_when_visible),
         ]
         for should_repopulate, fn in repopulate_steps:
             if should_repopulate:
@@ -162,9 +179,16 @@ class MainPanel(QtWidgets.QDialog):
         self._apply_active_document_change_plan(plan)
         self._update_copy_buttons_enabled_state()
 
+    def _index_named_widgets(self) -> dict[str, QtCore.QObject]:
+        # One walk over the form instead of a recursive findChild() per widget.
+        index: dict[str, QtCore.QObject] = {}
+        for child in self._widget.findChildren(QtCore.QObject):
+            index.setdefault(child.objectName(), child)
+        return index
+
     def _find_required_widget(self, widget_type: type, object_name: str):
-        widget = self._widget.findChild(widget_type, object_name)
-        if widget is None:
+        widget = self._named_widgets.get(object_name)
+        if not isinstance(widget, widget_type):
             raise RuntimeError(
                 self._app_port.translate(
                     "Log",
@@ -182,6 +206,15 @@ class MainPanel(QtWidgets.QDialog):
         return self.form
 
     def _find_widgets(self) -> None:
+        self._named_widgets = self._index_named_widgets()
+        try:
+            self._find_varsets_widgets()
+            self._find_aliases_widgets()
+            self._find_shared_widgets()
+        finally:
+            self._named_widgets = {}
+
+    def _find_varsets_widgets(self) -> None:
         self.availableVarsetsListWidget = self._find_required_widget(
             QtWidgets.QListWidget, "avaliableVarsetsListWidget"
         )
@@ -191,8 +224,6 @@ class MainPanel(QtWidgets.QDialog):
         self.varsetExpressionsListWidget = self._find_required_widget(
             QtWidgets.QListWidget, "varsetExpressionsListWidget"
         )
-        self.tabWidget = self._find_required_widget(QtWidgets.QTabWidget, "tabWidget")
-
         self.avaliableVarsetsFilterLineEdit = self._find_required_widget(
             QtWidgets.QLineEdit, "avaliableVarsetsFilterLineEdit"
         )
@@ -209,6 +240,7 @@ class MainPanel(QtWidgets.QDialog):
             QtWidgets.QPushButton, "removeUnusedVariablesPushButton"
         )
 
+    def _find_aliases_widgets(self) -> None:
         self.availableSpreadsheetsListWidget = self._find_required_widget(
             QtWidgets.QListWidget, "avaliableSpreadsheetsListWidget"
         )
@@ -235,6 +267,8 @@ class MainPanel(QtWidgets.QDialog):
             QtWidgets.QPushButton, "removeUnusedAliasesPushButton"
         )
 
+    def _find_shared_widgets(self) -> None:
+        self.tabWidget = self._find_required_widget(QtWidgets.QTabWidget, "tabWidget")
         self.varsetsSplitter = self._find_required_widget(QtWidgets.QSplitter, "splitter")
         self.aliasesSplitter = self._find_required_widget(QtWidgets.QSplitter, "aliases_splitter")
 
@@ -315,6 +349,7 @@ class MainPanel(QtWidgets.QDialog):
                 QtCore.QTimer.singleShot(0, self._update_copy_buttons_enabled_state)
         return super().eventFilter(watched, event)
 
+    @QtCore.Slot()
     def _update_copy_buttons_enabled_state(self) -> None:
         for list_widget, button in self._copy_map.items():
             if list_widget is None or button is None:
@@ -374,6 +409,11 @@ class MainPanel(QtWidgets.QDialog):
         if widget is None:
             return
         widget.setSelectionMode(selection_mode)
+        # Rows are single-line text, so uniform sizes let the view skip measuring
+        # every item, and batched layout keeps large lists responsive.
+        widget.setUniformItemSizes(True)
+        widget.setLayoutMode(QtWidgets.QListView.LayoutMode.Batched)
+        widget.setBatchSize(256)
         if adjust_to_contents:
             widget.setSizeAdjustPolicy(QtWidgets.QAbstractScrollArea.AdjustToContents)
 
@@ -523,7 +563,7 @@ class MainPanel(QtWidgets.QDialog):
                 item.setSelected(True)
 
     def _restore_list_selection(
-        self, widget: QtWidgets.QListWidget, *, selected_keys: set[str]
+        self, widget: QtWidgets.QListWidget, *, selected_keys: AbstractSet[str]
     ) -> None:
         if not selected_keys:
             return
@@ -540,7 +580,7 @@ class MainPanel(QtWidgets.QDialog):
         )
 
     def _restore_parent_child_ref_selection(
-        self, widget: QtWidgets.QListWidget, *, selected_refs: set[ParentChildRef]
+        self, widget: QtWidgets.QListWidget, *, selected_refs: AbstractSet[object]
     ) -> None:
         if not selected_refs:
             return
@@ -556,8 +596,7 @@ class MainPanel(QtWidgets.QDialog):
         widget = self.availableVarsetsListWidget
         if widget is None:
             return
-        selected = set(self._get_selected_varsets())
-        widget.clear()
+        selected = frozenset(self._get_selected_varsets())
         filter_text = self._get_line_edit_text(self.avaliableVarsetsFilterLineEdit)
         exclude_copy_on_change = self._is_radio_checked(
             self.avaliableVarsetsExcludeClonesRadioButton
@@ -568,15 +607,25 @@ class MainPanel(QtWidgets.QDialog):
             use_label=self._is_varsets_display_mode_label(),
             selected_keys=selected,
         )
-        self._populate_parent_list_widget(widget, state.items)
-        self._restore_list_selection(widget, selected_keys=state.selected_keys)
+        self._render_parent_list_widget(widget, state)
+
+    def _is_aliases_tab_current(self) -> bool:
+        return self.tabWidget is not None and self.tabWidget.currentIndex() == _ALIASES_TAB_INDEX
+
+    def _populate_spreadsheets_when_visible(self) -> None:
+        # The aliases tab is usually not the one on screen; defer its queries and
+        # list inserts until the tab is first shown (see `_on_tab_changed`).
+        if self._is_aliases_tab_current():
+            self._populate_spreadsheets()
+        else:
+            self._spreadsheets_stale = True
 
     def _populate_spreadsheets(self) -> None:
         widget = self.availableSpreadsheetsListWidget
         if widget is None:
             return
-        selected = set(self._get_selected_spreadsheets())
-        widget.clear()
+        self._spreadsheets_stale = False
+        selected = frozenset(self._get_selected_spreadsheets())
         filter_text = self._get_line_edit_text(self.avaliableSpreadsheetsFilterLineEdit)
         exclude_copy_on_change = self._is_radio_checked(
             self.excludeCopyOnChangeSpreadsheetsRadioButton
@@ -587,8 +636,23 @@ class MainPanel(QtWidgets.QDialog):
             use_label=self._is_aliases_display_mode_label(),
             selected_keys=selected,
         )
-        self._populate_parent_list_widget(widget, state.items)
-        self._restore_list_selection(widget, selected_keys=state.selected_keys)
+        self._render_parent_list_widget(widget, state)
+
+    def _render_parent_list_widget(
+        self, widget: QtWidgets.QListWidget, state: ParentListState
+    ) -> None:
+        # Toggles and filter edits often yield the same rows and selection as the
+        # list already shows; skip the clear-and-refill when nothing differs.
+        if self._rendered_parent_states.get(widget) == state:
+            return
+        self._rendered_parent_states[widget] = state
+        # Clearing the list and reselecting rows would emit itemSelectionChanged
+        # once per row, each rebuilding the dependent lists; every caller refreshes
+        # those lists itself afterwards, so keep the intermediate emissions quiet.
+        with _signals_blocked(widget):
+            self._populate_parent_list_widget(widget, state.items)
+            self._restore_list_selection(widget, selected_keys=state.selected_keys)
+        self._update_copy_buttons_enabled_state()
 
     def _get_line_edit_text(self, widget: QtWidgets.QLineEdit | None) -> str:
         if widget is None:
@@ -600,19 +664,36 @@ class MainPanel(QtWidgets.QDialog):
             return False
         return widget.isChecked()
 
+    def _replace_list_items(
+        self, widget: QtWidgets.QListWidget, items: list[QtWidgets.QListWidgetItem]
+    ) -> None:
+        # Build the items up front and swap them in with repaints suspended so
+        # the view does a single update instead of one per added row.
+        widget.setUpdatesEnabled(False)
+        try:
+            if widget.count() > 0:
+                widget.clear()
+            for item in items:
+                widget.addItem(item)
+        finally:
+            widget.setUpdatesEnabled(True)
+
+    def _create_parent_list_item(self, data) -> QtWidgets.QListWidgetItem | None:
+        key = getattr(data, "key", None)
+        display = getattr(data, "display", None)
+        if not isinstance(key, str) or not key:
+            return None
+        if not isinstance(display, str):
+            display = key
+        item = QtWidgets.QListWidgetItem(display)
+        item.setData(QtCore.Qt.UserRole, key)
+        return item
+
     def _populate_parent_list_widget(
         self, widget: QtWidgets.QListWidget, items: list[object]
     ) -> None:
-        for data in items:
-            key = getattr(data, "key", None)
-            display = getattr(data, "display", None)
-            if not isinstance(key, str) or not key:
-                continue
-            if not isinstance(display, str):
-                display = key
-            item = QtWidgets.QListWidgetItem(display)
-            item.setData(QtCore.Qt.UserRole, key)
-            widget.addItem(item)
+        list_items = [self._create_parent_list_item(data) for data in items]
+        self._replace_list_items(widget, [item for item in list_items if item is not None])
         self._adjust_list_widget_width_to_contents(widget)
 
     def _adjust_list_widget_width_to_contents(self, widget: QtWidgets.QListWidget) -> None:
@@ -675,7 +756,7 @@ class MainPanel(QtWidgets.QDialog):
             ),
             (
                 self.avaliableVarsetsFilterLineEdit,
-                lambda w: w.textChanged.connect(self._on_varsets_filter_changed),
+                lambda w: self._connect_debounced_text_changed(w, self._on_varsets_filter_changed),
             ),
             (
                 self.avaliableVarsetsExcludeClonesRadioButton,
@@ -683,7 +764,7 @@ class MainPanel(QtWidgets.QDialog):
             ),
             (
                 self.varsetVariableNamesFilterLineEdit,
-                lambda w: w.textChanged.connect(self._on_variable_filter_changed),
+                lambda w: self._connect_debounced_text_changed(w, self._on_variable_filter_changed),
             ),
             (
                 self.varsetVariableNamesOnlyUnusedCheckBox,
@@ -695,7 +776,9 @@ class MainPanel(QtWidgets.QDialog):
             ),
             (
                 self.avaliableSpreadsheetsFilterLineEdit,
-                lambda w: w.textChanged.connect(self._on_spreadsheets_filter_changed),
+                lambda w: self._connect_debounced_text_changed(
+                    w, self._on_spreadsheets_filter_changed
+                ),
             ),
             (
                 self.excludeCopyOnChangeSpreadsheetsRadioButton,
@@ -703,7 +786,7 @@ class MainPanel(QtWidgets.QDialog):
             ),
             (
                 self.aliasesVariableNamesFilterLineEdit,
-                lambda w: w.textChanged.connect(self._on_alias_filter_changed),
+                lambda w: self._connect_debounced_text_changed(w, self._on_alias_filter_changed),
             ),
             (
                 self.aliasesOnlyUnusedCheckBox,
@@ -739,9 +822,7 @@ class MainPanel(QtWidgets.QDialog):
             ),
             (
                 self.tabWidget,
-                lambda w: w.currentChanged.connect(
-                    lambda _idx: self._update_copy_buttons_enabled_state()
-                ),
+                lambda w: w.currentChanged.connect(self._on_tab_changed),
             ),
             (
                 self.copyAvailableVarsetsPushButton,
@@ -798,6 +879,24 @@ class MainPanel(QtWidgets.QDialog):
                 continue
             connector(widget)
 
+    def _connect_debounced_text_changed(
+        self, line_edit: QtWidgets.QLineEdit, handler: Callable[[str], None]
+    ) -> None:
+        # Each filter change rebuilds one or more lists; restart a single-shot
+        # timer per keystroke so the handler only runs once typing pauses.
+        timer = QtCore.QTimer(self)
+        timer.setSingleShot(True)
+        timer.setInterval(_FILTER_DEBOUNCE_MS)
+        timer.timeout.connect(lambda: handler(line_edit.text() or ""))
+        line_edit.textChanged.connect(lambda _text: timer.start())
+
+    @QtCore.Slot(int)
+    def _on_tab_changed(self, index: int) -> None:
+        if index == _ALIASES_TAB_INDEX and self._spreadsheets_stale:
+            self._populate_spreadsheets()
+        self._update_copy_buttons_enabled_state()
+
+    @QtCore.Slot(int, int)
     def _on_varsets_splitter_moved(self, _pos: int, _index: int) -> None:
         if self.varsetsSplitter is None:
             return
@@ -805,6 +904,7 @@ class MainPanel(QtWidgets.QDialog):
             _SETTING_VARSETS_SPLITTER_STATE, self.varsetsSplitter.saveState()
         )
 
+    @QtCore.Slot(int, int)
     def _on_aliases_splitter_moved(self, _pos: int, _index: int) -> None:
         if self.aliasesSplitter is None:
             return
@@ -815,6 +915,7 @@ class MainPanel(QtWidgets.QDialog):
     def _persist_display_mode(self, *, setting_key: str, mode: str) -> None:
         self._settings_port.set_value(setting_key, mode)
 
+    @QtCore.Slot(bool)
     def _on_varsets_object_display_mode_toggled(self, checked: bool) -> None:
         if not checked:
             return
@@ -829,12 +930,15 @@ class MainPanel(QtWidgets.QDialog):
         self._populate_varsets()
         self._populate_variable_names(selected_varsets)
         if self.varsetVariableNamesListWidget is not None:
-            self._restore_parent_child_ref_selection(
-                self.varsetVariableNamesListWidget,
-                selected_refs=selected_vars,
-            )
+            with _signals_blocked(self.varsetVariableNamesListWidget):
+                self._restore_parent_child_ref_selection(
+                    self.varsetVariableNamesListWidget,
+                    selected_refs=selected_vars,
+                )
+            self._update_copy_buttons_enabled_state()
         self._populate_expressions(self._get_selected_varset_variable_items())
 
+    @QtCore.Slot(bool)
     def _on_aliases_object_display_mode_toggled(self, checked: bool) -> None:
         if not checked:
             return
@@ -852,10 +956,12 @@ class MainPanel(QtWidgets.QDialog):
         self._populate_spreadsheets()
         self._populate_alias_names(selected_sheets)
         if self.aliasesVariableNamesListWidget is not None:
-            self._restore_parent_child_ref_selection(
-                self.aliasesVariableNamesListWidget,
-                selected_refs=selected_aliases,
-            )
+            with _signals_blocked(self.aliasesVariableNamesListWidget):
+                self._restore_parent_child_ref_selection(
+                    self.aliasesVariableNamesListWidget,
+                    selected_refs=selected_aliases,
+                )
+            self._update_copy_buttons_enabled_state()
         self._populate_alias_expressions(self._get_selected_alias_items())
 
     def _get_selected_varsets(self) -> list[str]:
@@ -922,7 +1028,7 @@ class MainPanel(QtWidgets.QDialog):
         if self.varsetVariableNamesOnlyUnusedCheckBox is not None:
             only_unused = self.varsetVariableNamesOnlyUnusedCheckBox.isChecked()
 
-        selected_refs = set(self._get_selected_varset_variable_items())
+        selected_refs = frozenset(self._get_selected_varset_variable_items())
         state = self._presenter.get_varset_variables_state(
             selected_varsets=selected_varsets,
             variable_filter_text=variable_filter_text,
@@ -944,7 +1050,7 @@ class MainPanel(QtWidgets.QDialog):
         if self.aliasesOnlyUnusedCheckBox is not None:
             only_unused = self.aliasesOnlyUnusedCheckBox.isChecked()
 
-        selected_refs = set(self._get_selected_alias_items())
+        selected_refs = frozenset(self._get_selected_alias_items())
         state = self._presenter.get_aliases_state(
             selected_spreadsheets=selected_sheets,
             alias_filter_text=alias_filter_text,
@@ -964,23 +1070,69 @@ class MainPanel(QtWidgets.QDialog):
         if list_widget is None:
             return
 
-        list_widget.clear()
-        for data in getattr(state, "items", []) or []:
-            list_widget.addItem(self._create_ref_list_item(data))
-
+        # As for the parent lists: callers refresh the expressions list
+        # themselves, so do not rebuild it for every row restored here.
+        with _signals_blocked(list_widget):
+            self._patch_ref_list_widget(list_widget, list(getattr(state, "items", []) or []))
+            self._restore_parent_child_ref_selection(
+                list_widget,
+                selected_refs=getattr(state, "selected_keys", None) or frozenset(),
+            )
         self._adjust_list_widget_width_to_contents(list_widget)
-        self._restore_parent_child_ref_selection(
-            list_widget,
-            selected_refs=set(getattr(state, "selected_keys", set()) or set()),
-        )
+        self._update_copy_buttons_enabled_state()
         on_after_render()
 
+    def _patch_ref_list_widget(self, list_widget: QtWidgets.QListWidget, items: list) -> None:
+        # Selecting one more parent usually only adds or removes a few children, so
+        # take out the stale rows and insert the new ones instead of rebuilding the
+        # list. This keeps the scroll position and the selection of retained rows.
+        new_keys = [getattr(data, "key", None) for data in items]
+        old_keys = [
+            list_widget.item(row).data(QtCore.Qt.UserRole) for row in range(list_widget.count())
+        ]
+        keep = set(new_keys)
+        old = set(old_keys)
+        if [k for k in old_keys if k in keep] != [k for k in new_keys if k in old]:
+            self._replace_list_items(list_widget, [self._create_ref_list_item(d) for d in items])
+            return
+
+        list_widget.setUpdatesEnabled(False)
+        try:
+            for row in range(len(old_keys) - 1, -1, -1):
+                if old_keys[row] not in keep:
+                    list_widget.takeItem(row)
+            for row, data in enumerate(items):
+                existing = list_widget.item(row)
+                if existing is None or existing.data(QtCore.Qt.UserRole) != new_keys[row]:
+                    list_widget.insertItem(row, self._create_ref_list_item(data))
+                    continue
+                text = self._create_ref_list_item_text(data, new_keys[row])
+                if existing.text() != text:
+                    existing.setText(text)
+        finally:
+            list_widget.setUpdatesEnabled(True)
+
+    def _create_ref_list_item_text(self, data, key: object = None) -> str:
+        display = getattr(data, "display", None)
+        if isinstance(display, str):
+            return display
+        if key is None:
+            key = getattr(data, "key", None)
+        return str(getattr(key, "text", ""))
+
     def _create_ref_list_item(self, data) -> QtWidgets.QListWidgetItem:
-        ref = getattr(data, "key", None)
+        key = getattr(data, "key", None)
+        item = QtWidgets.QListWidgetItem(self._create_ref_list_item_text(data, key))
+        item.setData(QtCore.Qt.UserRole, key)
+        return item
+
+    def _create_expression_list_item(self, data) -> QtWidgets.QListWidgetItem:
+        expr = getattr(data, "key", None)
         display = getattr(data, "display", None)
-        text = display if isinstance(display, str) else str(getattr(ref, "text", ""))
-        item = QtWidgets.QListWidgetItem(text)
-        item.setData(QtCore.Qt.UserRole, ref)
+        if not isinstance(display, str):
+            display = str(getattr(expr, "display_text", ""))
+        item = QtWidgets.QListWidgetItem(display)
+        item.setData(QtCore.Qt.UserRole, expr)
         return item
 
     def _render_variable_names(self, state) -> None:
@@ -996,19 +1148,14 @@ class MainPanel(QtWidgets.QDialog):
         if self.aliasExpressionsListWidget is None:
             return
 
-        self.aliasExpressionsListWidget.clear()
         state = self._presenter.get_alias_expressions_state(
             list(selected_alias_items),
             use_label=self._is_aliases_display_mode_label(),
         )
-        for data in getattr(state, "items", []) or []:
-            expr = getattr(data, "key", None)
-            display = getattr(data, "display", None)
-            if not isinstance(display, str):
-                display = str(getattr(expr, "display_text", ""))
-            item = QtWidgets.QListWidgetItem(display)
-            item.setData(QtCore.Qt.UserRole, expr)
-            self.aliasExpressionsListWidget.addItem(item)
+        self._replace_list_items(
+            self.aliasExpressionsListWidget,
+            [self._create_expression_list_item(data) for data in getattr(state, "items", []) or []],
+        )
 
         self._update_remove_unused_aliases_button_enabled_state()
 
@@ -1061,22 +1208,18 @@ class MainPanel(QtWidgets.QDialog):
         if self.varsetExpressionsListWidget is None:
             return
 
-        self.varsetExpressionsListWidget.clear()
         state = self._presenter.get_varset_expressions_state(
             list(selected_varset_variable_items),
             use_label=self._is_varsets_display_mode_label(),
         )
-        for data in getattr(state, "items", []) or []:
-            expr = getattr(data, "key", None)
-            display = getattr(data, "display", None)
-            if not isinstance(display, str):
-                display = str(getattr(expr, "display_text", ""))
-            item = QtWidgets.QListWidgetItem(display)
-            item.setData(QtCore.Qt.UserRole, expr)
-            self.varsetExpressionsListWidget.addItem(item)
+        self._replace_list_items(
+            self.varsetExpressionsListWidget,
+            [self._create_expression_list_item(data) for data in getattr(state, "items", []) or []],
+        )
 
         self._update_remove_unused_button_enabled_state()
 
+    @QtCore.Slot()
     def _on_alias_names_selection_changed(self):
         if self.aliasesVariableNamesListWidget is None or self.aliasExpressionsListWidget is None:
             return
@@ -1084,6 +1227,7 @@ class MainPanel(QtWidgets.QDialog):
         selected_aliases = self._get_selected_alias_items()
         self._populate_alias_expressions(selected_aliases)
 
+    @QtCore.Slot()
     def _on_available_varsets_selection_changed(self):
         if self.availableVarsetsListWidget is None or self.varsetVariableNamesListWidget is None:
             return
@@ -1094,6 +1238,7 @@ class MainPanel(QtWidgets.QDialog):
         if self.varsetExpressionsListWidget is not None:
             self.varsetExpressionsListWidget.clear()
 
+    @QtCore.Slot()
     def _on_available_spreadsheets_selection_changed(self):
         if (
             self.availableSpreadsheetsListWidget is None
@@ -1107,6 +1252,7 @@ class MainPanel(QtWidgets.QDialog):
         if self.aliasExpressionsListWidget is not None:
             self.aliasExpressionsListWidget.clear()
 
+    @QtCore.Slot()
     def _on_variable_names_selection_changed(self):
         if self.varsetVariableNamesListWidget is None or self.varsetExpressionsListWidget is None:
             return
@@ -1132,11 +1278,13 @@ class MainPanel(QtWidgets.QDialog):
         self._populate_alias_names(selected)
         self._populate_alias_expressions(self._get_selected_alias_items())
 
+    @QtCore.Slot(bool)
     def _on_only_unused_toggled(self, _checked: bool) -> None:
         selected_varsets = self._get_selected_varsets()
         self._populate_variable_names(selected_varsets)
         self._populate_expressions(self._get_selected_varset_variable_items())
 
+    @QtCore.Slot(bool)
     def _on_alias_only_unused_toggled(self, _checked: bool) -> None:
         selected = self._get_selected_spreadsheets()
         self._populate_alias_names(selected)
@@ -1194,6 +1342,7 @@ class MainPanel(QtWidgets.QDialog):
             self.varsetExpressionsListWidget.clear()
         self._update_remove_unused_button_enabled_state()
 
+    @QtCore.Slot()
     def _on_remove_unused_variables_clicked(self) -> None:
         if self.varsetVariableNamesListWidget is None:
             return
@@ -1257,6 +1406,7 @@ class MainPanel(QtWidgets.QDialog):
             self.aliasExpressionsListWidget.clear()
         self._update_remove_unused_aliases_button_enabled_state()
 
+    @QtCore.Slot()
     def _on_remove_unused_aliases_clicked(self) -> None:
         if self.aliasesVariableNamesListWidget is None:
             return
@@ -1287,14 +1437,17 @@ class MainPanel(QtWidgets.QDialog):
         self._show_remove_unused_errors(combined.remove_result)
         self._apply_post_remove_aliases_update(combined.update)
 
+    @QtCore.Slot(bool)
     def _on_exclude_clones_toggled(self, _checked: bool) -> None:
         self._populate_varsets()
         self._on_available_varsets_selection_changed()
 
+    @QtCore.Slot(bool)
     def _on_exclude_spreadsheet_clones_toggled(self, _checked: bool) -> None:
         self._populate_spreadsheets()
         self._on_available_spreadsheets_selection_changed()
 
+    @QtCore.Slot()
     def _on_expressions_selection_changed(self):
         if self.varsetExpressionsListWidget is None:
             return
@@ -1309,6 +1462,7 @@ class MainPanel(QtWidgets.QDialog):
         else:
             self._controller.select_expression_item(selected[0].text())
 
+    @QtCore.Slot()
     def _on_alias_expressions_selection_changed(self):
         if self.aliasExpressionsListWidget is None:
             return
@@ -9,42 +9,60 @@ Qt widgets in `MainPanel` as a thin view layer.
 
 from __future__ import annotations
 
-import fnmatch
+import contextlib
+from collections.abc import Callable, Hashable, Iterator
+from collections.abc import Set as AbstractSet
 from dataclasses import dataclass
+from typing import Any, TypeVar
 
+from ..domain.parent_child_ref import ParentChildRef
+from ..domain.tab_controller import compile_glob_matcher
 
-@dataclass(frozen=True)
+_K = TypeVar("_K", bound=Hashable)
+
+
+def _freeze(keys: AbstractSet[_K]) -> frozenset[_K]:
+    # The states keep the caller's selection; reuse it when it is already frozen.
+    return keys if isinstance(keys, frozenset) else frozenset(keys)
+
+
+@dataclass(frozen=True, slots=True)
 class DisplayItem:
     """An item to display in a list widget."""
 
     key: object
     display: str
 
+    @classmethod
+    def identity(cls, name: str) -> DisplayItem:
+        """Return an item displaying its own key, sharing the same string."""
+        return cls(key=name, display=name)
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ParentListState:
     """Render-state for a parent list widget (VarSets or Spreadsheets)."""
 
     items: list[DisplayItem]
-    selected_keys: set[str]
+    selected_keys: frozenset[str]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ChildListState:
     """Render-state for a child list widget (variables/aliases)."""
 
     items: list[DisplayItem]
-    selected_keys: set[object]
+    selected_keys: frozenset[object]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExpressionListState:
     """Render-state for an expressions list widget."""
 
     items: list[DisplayItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ActiveDocumentChangePlan:
     """Presenter-defined orchestration plan for an active document change."""
 
@@ -58,7 +76,7 @@ class ActiveDocumentChangePlan:
     clear_alias_expressions: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ShowPlan:
     """Presenter-defined plan for showing the panel."""
 
@@ -67,11 +85,37 @@ class ShowPlan:
     create_subwindow: bool
 
 
+def _bind_controller_method(controller: object, name: str) -> Callable[..., Any] | None:
+    method = getattr(controller, name, None)
+    return method if callable(method) else None
+
+
 class MainPanelPresenter:
     """Presenter for `MainPanel` interactions and formatting."""
 
     def __init__(self, controller: object) -> None:
         self._controller = controller
+        # Resolve the optional controller methods once; formatting calls them for
+        # every list item.
+        self._get_object_label_fn = _bind_controller_method(controller, "get_object_label")
+        self._should_enable_remove_unused_fn = _bind_controller_method(
+            controller, "should_enable_remove_unused"
+        )
+        self._get_filtered_varsets_fn = _bind_controller_method(controller, "get_filtered_varsets")
+        self._get_filtered_spreadsheets_fn = _bind_controller_method(
+            controller, "get_filtered_spreadsheets"
+        )
+        self._get_filtered_varset_variable_items_fn = _bind_controller_method(
+            controller, "get_filtered_varset_variable_items"
+        )
+        self._get_filtered_spreadsheet_alias_items_fn = _bind_controller_method(
+            controller, "get_filtered_spreadsheet_alias_items"
+        )
+        self._get_expression_items_fn = _bind_controller_method(controller, "get_expression_items")
+        self._get_alias_expression_items_fn = _bind_controller_method(
+            controller, "get_alias_expression_items"
+        )
+        self._label_cache: dict[str, str | None] | None = None
 
     def get_active_document_change_plan(self) -> ActiveDocumentChangePlan:
         """Return an orchestration plan for when the active document changes."""
@@ -90,8 +134,8 @@ class MainPanelPresenter:
     def should_enable_remove_unused(self, *, only_unused: bool, selected_count: int) -> bool:
         """Return whether the remove-unused action should be enabled."""
 
-        getter = getattr(self._controller, "should_enable_remove_unused", None)
-        if not callable(getter):
+        getter = self._should_enable_remove_unused_fn
+        if getter is None:
             return False
         value: object = getter(only_unused=only_unused, selected_count=selected_count)
         return bool(value)
@@ -110,9 +154,28 @@ class MainPanelPresenter:
             return ShowPlan(show_standalone=False, reuse_subwindow=True, create_subwindow=False)
         return ShowPlan(show_standalone=False, reuse_subwindow=False, create_subwindow=True)
 
+    @contextlib.contextmanager
+    def _memoized_labels(self) -> Iterator[None]:
+        # Lists repeat the same parent object for many rows; within one render
+        # pass, ask the controller (and so FreeCAD) once per distinct object.
+        self._label_cache = {}
+        try:
+            yield
+        finally:
+            self._label_cache = None
+
     def _get_object_label(self, object_name: str) -> str | None:
-        getter = getattr(self._controller, "get_object_label", None)
-        if not callable(getter):
+        cache = self._label_cache
+        if cache is not None and object_name in cache:
+            return cache[object_name]
+        label = self._lookup_object_label(object_name)
+        if cache is not None:
+            cache[object_name] = label
+        return label
+
+    def _lookup_object_label(self, object_name: str) -> str | None:
+        getter = self._get_object_label_fn
+        if getter is None:
             return None
         value: object = getter(object_name)
         if isinstance(value, str) and value:
@@ -124,8 +187,8 @@ class MainPanelPresenter:
         if not use_label:
             return object_name
 
-        if "." in object_name:
-            base_name, suffix = object_name.split(".", 1)
+        base_name, sep, suffix = object_name.partition(".")
+        if sep:
             base_label = self._get_object_label(base_name)
             if base_label:
                 return f"{base_label}.{suffix}"
@@ -142,6 +205,10 @@ class MainPanelPresenter:
         """
 
         if not use_label:
+            # Fast path for the default name mode: refs from the data sources are
+            # `ParentChildRef`s, whose text needs no probing or conversion.
+            if isinstance(ref, ParentChildRef):
+                return ref.text
             return str(getattr(ref, "text", ""))
 
         parent = getattr(ref, "parent", None)
@@ -190,9 +257,9 @@ class MainPanelPresenter:
         return f"{self._replace_lhs_object_with_label(lhs, obj_label)} {operator} {rhs}"
 
     def _replace_lhs_object_with_label(self, lhs: str, obj_label: str) -> str:
-        if "." not in lhs:
+        _prefix, sep, rest = lhs.partition(".")
+        if not sep:
             return lhs
-        _prefix, rest = lhs.split(".", 1)
         return f"{obj_label}.{rest}"
 
     def get_varsets_state(
@@ -201,41 +268,48 @@ class MainPanelPresenter:
         filter_text: str,
         exclude_copy_on_change: bool,
         use_label: bool,
-        selected_keys: set[str],
+        selected_keys: AbstractSet[str],
     ) -> ParentListState:
         """Return render state for the VarSets parent list."""
-        getter = getattr(self._controller, "get_filtered_varsets", None)
-        if not callable(getter):
-            return ParentListState(items=[], selected_keys=set())
+        getter = self._get_filtered_varsets_fn
+        if getter is None:
+            return ParentListState(items=[], selected_keys=frozenset())
 
         raw_names: list[str] = getter(
             filter_text="" if use_label else filter_text,
             exclude_copy_on_change=exclude_copy_on_change,
         )
 
-        items = [
-            DisplayItem(key=n, display=self.format_object_name(n, use_label=use_label))
-            for n in raw_names
-        ]
-        if use_label:
-            items = self._filter_display_items(items, filter_text=filter_text)
-        return ParentListState(items=items, selected_keys=set(selected_keys))
-
-    def _normalize_glob_pattern(self, text: str) -> str | None:
-        stripped = text.strip()
-        if not stripped:
-            return None
-        if not any(ch in stripped for ch in "*?[]"):
-            return f"*{stripped}*"
-        return stripped
+        return self._build_parent_list_state(
+            raw_names, filter_text=filter_text, use_label=use_label, selected_keys=selected_keys
+        )
+
+    def _build_parent_list_state(
+        self,
+        raw_names: list[str],
+        *,
+        filter_text: str,
+        use_label: bool,
+        selected_keys: AbstractSet[str],
+    ) -> ParentListState:
+        if not use_label:
+            # Name mode shows the names as-is and the controller already filtered them.
+            items = [DisplayItem.identity(n) for n in raw_names]
+            return ParentListState(items=items, selected_keys=_freeze(selected_keys))
+
+        format_name = self.format_object_name
+        with self._memoized_labels():
+            items = [DisplayItem(key=n, display=format_name(n, use_label=True)) for n in raw_names]
+        items = self._filter_display_items(items, filter_text=filter_text)
+        return ParentListState(items=items, selected_keys=_freeze(selected_keys))
 
     def _filter_display_items(
         self, items: list[DisplayItem], *, filter_text: str
     ) -> list[DisplayItem]:
-        pattern = self._normalize_glob_pattern(filter_text)
-        if pattern is None:
+        matches = compile_glob_matcher(filter_text)
+        if matches is None:
             return items
-        return [item for item in items if fnmatch.fnmatchcase(item.display, pattern)]
+        return [item for item in items if matches(item.display)]
 
     def get_varset_variables_state(
         self,
@@ -244,13 +318,13 @@ class MainPanelPresenter:
         variable_filter_text: str,
         only_unused: bool,
         use_label: bool,
-        selected_refs: set[object],
+        selected_refs: AbstractSet[object],
     ) -> ChildListState:
         """Return render state for the VarSet variables list."""
 
-        getter = getattr(self._controller, "get_filtered_varset_variable_items", None)
-        if not callable(getter):
-            return ChildListState(items=[], selected_keys=set())
+        getter = self._get_filtered_varset_variable_items_fn
+        if getter is None:
+            return ChildListState(items=[], selected_keys=frozenset())
 
         refs: list[object] = getter(
             selected_varsets=selected_varsets,
@@ -258,11 +332,12 @@ class MainPanelPresenter:
             only_unused=only_unused,
         )
 
-        items = [
-            DisplayItem(key=ref, display=self.format_parent_child_ref(ref, use_label=use_label))
-            for ref in refs
-        ]
-        return ChildListState(items=items, selected_keys=set(selected_refs))
+        format_ref = self.format_parent_child_ref
+        with self._memoized_labels():
+            items = [
+                DisplayItem(key=ref, display=format_ref(ref, use_label=use_label)) for ref in refs
+            ]
+        return ChildListState(items=items, selected_keys=_freeze(selected_refs))
 
     def get_varset_expressions_state(
         self,
@@ -272,16 +347,18 @@ class MainPanelPresenter:
     ) -> ExpressionListState:
         """Return render state for the VarSet expressions list."""
 
-        getter = getattr(self._controller, "get_expression_items", None)
-        if not callable(getter):
+        getter = self._get_expression_items_fn
+        if getter is None:
             return ExpressionListState(items=[])
 
         expr_items, _counts = getter(selected_varset_variable_items)
 
-        items = [
-            DisplayItem(key=expr, display=self.format_expression_item(expr, use_label=use_label))
-            for expr in expr_items
-        ]
+        format_expr = self.format_expression_item
+        with self._memoized_labels():
+            items = [
+                DisplayItem(key=expr, display=format_expr(expr, use_label=use_label))
+                for expr in expr_items
+            ]
         return ExpressionListState(items=items)
 
     def get_aliases_state(
@@ -291,13 +368,13 @@ class MainPanelPresenter:
         alias_filter_text: str,
         only_unused: bool,
         use_label: bool,
-        selected_refs: set[object],
+        selected_refs: AbstractSet[object],
     ) -> ChildListState:
         """Return render state for the aliases list."""
 
-        getter = getattr(self._controller, "get_filtered_spreadsheet_alias_items", None)
-        if not callable(getter):
-            return ChildListState(items=[], selected_keys=set())
+        getter = self._get_filtered_spreadsheet_alias_items_fn
+        if getter is None:
+            return ChildListState(items=[], selected_keys=frozenset())
 
         refs: list[object] = getter(
             selected_spreadsheets=selected_spreadsheets,
@@ -305,11 +382,12 @@ class MainPanelPresenter:
             only_unused=only_unused,
         )
 
-        items = [
-            DisplayItem(key=ref, display=self.format_parent_child_ref(ref, use_label=use_label))
-            for ref in refs
-        ]
-        return ChildListState(items=items, selected_keys=set(selected_refs))
+        format_ref = self.format_parent_child_ref
+        with self._memoized_labels():
+            items = [
+                DisplayItem(key=ref, display=format_ref(ref, use_label=use_label)) for ref in refs
+            ]
+        return ChildListState(items=items, selected_keys=_freeze(selected_refs))
 
     def get_alias_expressions_state(
         self,
@@ -319,15 +397,17 @@ class MainPanelPresenter:
     ) -> ExpressionListState:
         """Return render state for the alias expressions list."""
 
-        getter = getattr(self._controller, "get_alias_expression_items", None)
-        if not callable(getter):
+        getter = self._get_alias_expression_items_fn
+        if getter is None:
             return ExpressionListState(items=[])
 
         expr_items, _counts = getter(selected_alias_items)
-        items = [
-            DisplayItem(key=expr, display=self.format_expression_item(expr, use_label=use_label))
-            for expr in expr_items
-        ]
+        format_expr = self.format_expression_item
+        with self._memoized_labels():
+            items = [
+                DisplayItem(key=expr, display=format_expr(expr, use_label=use_label))
+                for expr in expr_items
+            ]
         return ExpressionListState(items=items)
 
     def get_spreadsheets_state(
@@ -336,22 +416,18 @@ class MainPanelPresenter:
         filter_text: str,
         exclude_copy_on_change: bool,
         use_label: bool,
-        selected_keys: set[str],
+        selected_keys: AbstractSet[str],
     ) -> ParentListState:
         """Return render state for the Spreadsheets parent list."""
-        getter = getattr(self._controller, "get_filtered_spreadsheets", None)
-        if not callable(getter):
-            return ParentListState(items=[], selected_keys=set())
+        getter = self._get_filtered_spreadsheets_fn
+        if getter is None:
+            return ParentListState(items=[], selected_keys=frozenset())
 
         raw_names: list[str] = getter(
             filter_text="" if use_label else filter_text,
             exclude_copy_on_change=exclude_copy_on_change,
         )
 
-        items = [
-            DisplayItem(key=n, display=self.format_object_name(n, use_label=use_label))
-            for n in raw_names
-        ]
-        if use_label:
-            items = self._filter_display_items(items, filter_text=filter_text)
-        return ParentListState(items=items, selected_keys=set(selected_keys))
+        return self._build_parent_list_state(
+            raw_names, filter_text=filter_text, use_label=use_label, selected_keys=selected_keys
+        )
@@ -8,6 +8,8 @@ tab-generic logic to `TabController` instances and owns document recompute and
 GUI refresh behavior.
 """
 
+import sys
+
 from ..domain.expression_item import ExpressionItem
 from ..domain.parent_child_ref import ParentChildRef
 from ..domain.tab_controller import TabController
@@ -16,6 +18,7 @@ from ..domain.tab_datasource import (
     RemoveUnusedAndUpdateResult,
     RemoveUnusedResult,
 )
+from ..ports.document_observer import install_document_observer
 from ..ports.freecad_context import FreeCadContext, get_runtime_context
 from ..ports.freecad_port import FreeCadPort, get_port
 from ..spreadsheets.spreadsheet_datasource import SpreadsheetDataSource
@@ -35,14 +38,22 @@ class PanelController:
     def __init__(self, *, ctx: FreeCadContext | None = None) -> None:
         self._ctx = ctx or get_runtime_context()
         self._port: FreeCadPort = get_port(self._ctx)
+        install_document_observer(self._ctx.app)
         self._varsets_tab_controller = TabController(VarsetDataSource(ctx=self._ctx))
         self._aliases_tab_controller = TabController(SpreadsheetDataSource(ctx=self._ctx))
 
-    def refresh_document(self) -> None:
+    def refresh_document(self, *, changed: bool = True) -> None:
         """Recompute the active document and refresh the FreeCAD GUI.
 
+        Args:
+            changed: Whether the document was actually modified. When ``False``
+                the recompute and GUI update are skipped, since there is nothing
+                new to compute or draw.
+
         Any exceptions are swallowed to keep the UI responsive.
         """
+        if not changed:
+            return
         self._port.try_recompute_active_document()
         self._port.try_update_gui()
 
@@ -107,7 +118,7 @@ class PanelController:
 
     def get_varset_variable_items(self, selected_varsets: list[str]) -> list[str]:
         """Return `VarSet.Variable` strings for the selected VarSets."""
-        return [ref.text for ref in self.get_varset_variable_refs(selected_varsets)]
+        return [sys.intern(ref.text) for ref in self.get_varset_variable_refs(selected_varsets)]
 
     def get_varset_variable_refs(self, selected_varsets: list[str]) -> list[ParentChildRef]:
         """Return structured variable refs for the selected VarSets."""
@@ -156,7 +167,7 @@ class PanelController:
             child_filter_text=variable_filter_text,
             only_unused=only_unused,
         )
-        self.refresh_document()
+        self.refresh_document(changed=bool(combined.remove_result.removed))
         return combined
 
     def get_expression_items(
@@ -176,7 +187,7 @@ class PanelController:
     ) -> RemoveUnusedResult:
         """Remove unused variables (VarSets tab) and refresh the document."""
         result = self._varsets_tab_controller.remove_unused_children(selected_varset_variable_items)
-        self.refresh_document()
+        self.refresh_document(changed=bool(result.removed))
         return result
 
     def get_sorted_spreadsheets(self, *, exclude_copy_on_change: bool = False) -> list[str]:
@@ -252,7 +263,7 @@ class PanelController:
             child_filter_text=alias_filter_text,
             only_unused=only_unused,
         )
-        self.refresh_document()
+        self.refresh_document(changed=bool(combined.remove_result.removed))
         return combined
 
     def select_expression_item(self, expression_item: ExpressionItem | str) -> None:
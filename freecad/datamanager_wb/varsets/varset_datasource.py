@@ -6,14 +6,22 @@
 Adapts varset document-model operations to the generic `TabController`.
 """
 
-from ..domain.expression_item import ExpressionItem
-from ..domain.parent_child_ref import ParentChildRef, normalize_parent_child_items
+import operator
+import sys
+from collections.abc import Iterable, Iterator
+
+from ..domain.expression_item import ExpressionItem, by_display_text
+from ..domain.parent_child_ref import (
+    ParentChildRef,
+    normalize_parent_child_items,
+    parse_parent_child_ref,
+)
 from ..domain.parsing_helpers import parse_varset_variable_item
 from ..domain.tab_datasource import RemoveUnusedResult, TabDataSource
 from ..ports.freecad_context import FreeCadContext
 from .varset_mutations import removeVarsetVariable
 from .varset_query import (
-    getVarsetReferences,
+    getVarsetReferencesBatch,
     getVarsets,
     getVarsetVariableGroups,
     getVarsetVariableNames,
@@ -21,6 +29,24 @@ from .varset_query import (
 )
 
 
+def _iter_child_ref_entries(
+    varset_name: str, var_names: Iterable[str]
+) -> Iterator[tuple[str, ParentChildRef]]:
+    if not varset_name or "." in varset_name:
+        # Unresolved `VarSet.Group` selections keep the `parent.child` split of
+        # the combined text, like any other dotted item.
+        for var_name in var_names:
+            ref = parse_parent_child_ref(f"{varset_name}.{var_name}")
+            if ref is not None:
+                yield ref.text, ref
+        return
+    parent = sys.intern(varset_name)
+    for var_name in var_names:
+        if var_name:
+            ref = ParentChildRef(parent=parent, child=var_name)
+            yield ref.text, ref
+
+
 class VarsetDataSource(TabDataSource):
     """Adapter that exposes VarSets through the `TabDataSource` protocol.
 
@@ -44,20 +70,17 @@ class VarsetDataSource(TabDataSource):
         ):
             parents.append(varset_name)
 
-            groups = set(getVarsetVariableGroups(varset_name, ctx=self._ctx).values())
+            groups = self._get_varset_groups(varset_name)
             if len(groups) <= 1:
                 continue
-            for group in sorted(groups):
-                parents.append(f"{varset_name}.{group}")
+            parents.extend(f"{varset_name}.{group}" for group in sorted(groups))
         return parents
 
     def _get_varset_groups(self, varset_name: str) -> set[str]:
         return set(getVarsetVariableGroups(varset_name, ctx=self._ctx).values())
 
     def _split_virtual_parent(self, text: str) -> tuple[str, str] | None:
-        if "." not in text:
-            return None
-        varset_name, group = text.split(".", 1)
+        varset_name, _sep, group = text.partition(".")
         if not varset_name or not group:
             return None
         return varset_name, group
@@ -82,22 +105,31 @@ class VarsetDataSource(TabDataSource):
 
     def get_child_refs(self, selected_parents: list[str]) -> list[ParentChildRef]:
         """Return variable refs for the selected VarSets."""
-        variable_items: list[str] = []
+        entries: list[tuple[str, ParentChildRef]] = []
         for parent in selected_parents:
             varset_name, var_names = self._get_var_names_for_parent(parent)
+            entries.extend(_iter_child_ref_entries(varset_name, var_names))
 
-            for var_name in var_names:
-                variable_items.append(f"{varset_name}.{var_name}")
+        # Sort on the `parent.child` text, which is the order the list shows.
+        entries.sort(key=operator.itemgetter(0))
+        return [ref for _text, ref in entries]
 
-        variable_items.sort()
-        refs: list[ParentChildRef] = []
-        for text in variable_items:
-            parsed = parse_varset_variable_item(text)
-            if parsed is None:
-                continue
-            parent, child = parsed
-            refs.append(ParentChildRef(parent=parent, child=child))
-        return refs
+    def _iter_variable_references(
+        self, selected_children: list[ParentChildRef] | list[str]
+    ) -> Iterator[tuple[str, tuple[str, str] | None, dict[str, str]]]:
+        # One parse per selected variable and one document pass for all of them,
+        # shared by the expression, count and remove-unused paths. The references
+        # are a snapshot taken before the first item is consumed; they are not
+        # re-read between items.
+        selection = [
+            (text, parse_varset_variable_item(text))
+            for text in normalize_parent_child_items(selected_children)
+        ]
+        references = getVarsetReferencesBatch(
+            [parsed for _text, parsed in selection if parsed is not None], ctx=self._ctx
+        )
+        for text, parsed in selection:
+            yield text, parsed, references[parsed] if parsed is not None else {}
 
     def get_expression_items(
         self, selected_children: list[ParentChildRef] | list[str]
@@ -106,54 +138,52 @@ class VarsetDataSource(TabDataSource):
         expression_items: list[ExpressionItem] = []
         counts: dict[str, int] = {}
 
-        for text in normalize_parent_child_items(selected_children):
-            parsed = parse_varset_variable_item(text)
+        for text, parsed, refs in self._iter_variable_references(selected_children):
             if parsed is None:
                 continue
-            varset_name, variable_name = parsed
-            refs = getVarsetReferences(varset_name, variable_name, ctx=self._ctx)
-            counts[text] = len(refs)
-            for k, v in refs.items():
-                object_name = k.split(".", 1)[0].strip()
-                expression_items.append(ExpressionItem(object_name=object_name, lhs=k, rhs=v))
+            counts[sys.intern(text)] = len(refs)
+            expression_items.extend(
+                ExpressionItem(object_name=k.partition(".")[0].strip(), lhs=k, rhs=v)
+                for k, v in refs.items()
+            )
 
-        expression_items.sort(key=lambda item: item.display_text)
+        expression_items.sort(key=by_display_text)
         return expression_items, counts
 
     def get_expression_reference_counts(
         self, selected_children: list[ParentChildRef] | list[str]
     ) -> dict[str, int]:
         """Return expression reference counts for the selected variables."""
-        counts: dict[str, int] = {}
-
-        for text in normalize_parent_child_items(selected_children):
-            parsed = parse_varset_variable_item(text)
-            if parsed is None:
-                continue
-            varset_name, variable_name = parsed
-            refs = getVarsetReferences(varset_name, variable_name, ctx=self._ctx)
-            counts[text] = len(refs)
-
-        return counts
+        return {
+            sys.intern(text): len(refs)
+            for text, parsed, refs in self._iter_variable_references(selected_children)
+            if parsed is not None
+        }
 
     def remove_unused_children(
         self, selected_children: list[ParentChildRef] | list[str]
     ) -> RemoveUnusedResult:
-        """Remove variables that have no expression references."""
+        """Remove variables that have no expression references.
+
+        References for the whole selection are snapshotted once, before anything
+        is removed. That is safe: an unused variable has no expressions pointing
+        at it, so removing it only ever drops expressions (e.g. one bound to the
+        removed variable itself). The snapshot can therefore only overstate the
+        references of the remaining variables, which keeps them as still used;
+        it never lets a referenced variable be removed.
+        """
         removed: list[str] = []
         still_used: list[str] = []
         failed: list[str] = []
 
-        for text in normalize_parent_child_items(selected_children):
-            parsed = parse_varset_variable_item(text)
+        for text, parsed, refs in self._iter_variable_references(selected_children):
             if parsed is None:
                 failed.append(text)
                 continue
-            varset_name, variable_name = parsed
-            refs = getVarsetReferences(varset_name, variable_name, ctx=self._ctx)
             if refs:
                 still_used.append(text)
                 continue
+            varset_name, variable_name = parsed
             ok = removeVarsetVariable(varset_name, variable_name, ctx=self._ctx)
             if ok:
                 removed.append(text)
@@ -11,8 +11,7 @@ from ..ports.freecad_port import get_port
 
 
 def _has_property(obj: object, property_name: str) -> bool:
-    props = set(getattr(obj, "PropertiesList", []) or [])
-    return property_name in props
+    return property_name in (getattr(obj, "PropertiesList", None) or ())
 
 
 def _try_remove_property(obj: object, property_name: str) -> bool:
@@ -7,95 +7,51 @@ Provides functions to list varsets, list their variables, and find expression
 references to varset variables.
 """
 
+import functools
 import re
-from collections.abc import Iterator
+from collections.abc import Callable, Iterable, Iterator
 
 from ..freecad_helpers import (
     build_expression_key,
-    get_copy_on_change_names,
+    document_memo,
+    get_copy_on_change_ids,
     get_object_name,
-    iter_document_objects,
+    iter_document_objects_of_type,
     iter_named_expression_engine_entries,
 )
 from ..ports.freecad_context import FreeCadContext
-from ..ports.freecad_port import get_port
+from ..ports.freecad_port import FreeCadPort, get_port
 
 
-def _iter_varset_names(doc: object) -> Iterator[str]:
+def _iter_filtered_varset_names(*, doc: object, excluded: frozenset[int]) -> Iterator[str]:
     for obj in _iter_varset_objects(doc):
+        if id(obj) in excluded:
+            continue
         name = get_object_name(obj)
         if name is not None:
             yield name
 
 
-def _iter_filtered_varset_names(
-    *,
-    doc: object,
-    excluded: set[str],
-    exclude_copy_on_change: bool,
-) -> Iterator[str]:
-    for name in _iter_varset_names(doc):
-        if exclude_copy_on_change and name in excluded:
-            continue
-        yield name
-
-
+@functools.lru_cache(maxsize=256)
 def _build_varset_search(
     *,
     varset_name: str,
     variable_name: str | None,
-) -> tuple[list[str], re.Pattern[str] | None]:
-    patterns: list[str] = [f"<<{varset_name}>>"]
+) -> tuple[tuple[str, ...], re.Pattern[str] | None]:
+    patterns: tuple[str, ...] = (f"<<{varset_name}>>",)
     if not variable_name:
         return patterns, None
 
-    patterns = [
+    patterns = (
         f"<<{varset_name}>>.{variable_name}",
         f"{varset_name}.{variable_name}",
-    ]
+    )
     internal_var_re = re.compile(rf"(?<![A-Za-z0-9_]){re.escape(variable_name)}(?![A-Za-z0-9_])")
     return patterns, internal_var_re
 
 
-def _matches_varset_expression(
-    *,
-    expr_text: object,
-    patterns: list[str],
-    internal_var_re: re.Pattern[str] | None,
-    obj: object,
-    varset_name: str,
-) -> bool:
-    text = str(expr_text)
-    if any(p in text for p in patterns):
-        return True
-    return _matches_internal_var_ref(
-        internal_var_re=internal_var_re,
-        obj=obj,
-        varset_name=varset_name,
-        text=text,
-    )
-
-
-def _matches_internal_var_ref(
-    *,
-    internal_var_re: re.Pattern[str] | None,
-    obj: object,
-    varset_name: str,
-    text: str,
-) -> bool:
-    if internal_var_re is None:
-        return False
-    if getattr(obj, "TypeId", None) != "App::VarSet":
-        return False
-    if getattr(obj, "Name", None) != varset_name:
-        return False
-    return internal_var_re.search(text) is not None
-
-
 def _iter_varset_objects(doc: object) -> Iterator[object]:
-    for obj in iter_document_objects(doc):
-        if getattr(obj, "TypeId", None) == "App::VarSet":
-            yield obj
+    yield from iter_document_objects_of_type(doc, "App::VarSet")
 
 
 def getVarsets(
@@ -116,20 +72,17 @@ def getVarsets(
     if doc is None:
         return
 
-    excluded: set[str] = (
-        get_copy_on_change_names(doc=doc, type_id="App::VarSet")
+    excluded: frozenset[int] = (
+        get_copy_on_change_ids(doc=doc, type_id="App::VarSet")
         if exclude_copy_on_change
-        else set()
-    )
-    yield from _iter_filtered_varset_names(
-        doc=doc,
-        excluded=excluded,
-        exclude_copy_on_change=exclude_copy_on_change,
+        else frozenset()
     )
+    yield from _iter_filtered_varset_names(doc=doc, excluded=excluded)
 
 
-def _is_excluded_varset_property(prop: object) -> bool:
-    excluded = {
+# Built-in FreeCAD properties that are not user-defined VarSet variables.
+_EXCLUDED_VARSET_PROPERTIES = frozenset(
+    {
         "ExpressionEngine",
         "Label",
         "Label2",
@@ -142,17 +95,26 @@ def _is_excluded_varset_property(prop: object) -> bool:
         "State",
         "ViewObject",
     }
-    return str(prop) in excluded
+)
+
+
+def _iter_varset_variable_names(varset: object) -> Iterator[str]:
+    for prop in getattr(varset, "PropertiesList", None) or ():
+        name = str(prop)
+        if name not in _EXCLUDED_VARSET_PROPERTIES:
+            yield name
 
 
 def _collect_varset_variable_names(varset: object) -> list[str]:
-    names: list[str] = []
-    for prop in getattr(varset, "PropertiesList", []):
-        if _is_excluded_varset_property(prop):
-            continue
-        names.append(str(prop))
-    names.sort()
-    return names
+    return sorted(_iter_varset_variable_names(varset))
+
+
+def _get_active_varset(varset_name: str, *, ctx: FreeCadContext | None = None) -> object | None:
+    port = get_port(ctx)
+    doc = port.get_active_document()
+    if doc is None:
+        return None
+    return port.get_typed_object(doc, varset_name, type_id="App::VarSet")
 
 
 def _get_varset_property_group(varset: object, prop: str) -> str:
@@ -177,21 +139,14 @@ def getVarsetVariableGroups(
     groups (property group). When no group is defined, FreeCAD uses "Base".
     """
 
-    doc = get_port(ctx).get_active_document()
-    if doc is None:
-        return {}
-
-    varset = get_port(ctx).get_typed_object(doc, varset_name, type_id="App::VarSet")
+    varset = _get_active_varset(varset_name, ctx=ctx)
     if varset is None:
         return {}
 
-    groups: dict[str, str] = {}
-    for prop in getattr(varset, "PropertiesList", []):
-        if _is_excluded_varset_property(prop):
-            continue
-        name = str(prop)
-        groups[name] = _get_varset_property_group(varset, name)
-    return groups
+    return {
+        name: _get_varset_property_group(varset, name)
+        for name in _iter_varset_variable_names(varset)
+    }
 
 
 def getVarsetVariableNamesForGroup(
@@ -202,15 +157,18 @@ def getVarsetVariableNamesForGroup(
 ) -> list[str]:
     """Return variable/property names defined on a VarSet, optionally filtered by group."""
 
-    names = getVarsetVariableNames(varset_name, ctx=ctx)
+    varset = _get_active_varset(varset_name, ctx=ctx)
+    if varset is None:
+        return []
     if not group_name:
-        return names
+        return _collect_varset_variable_names(varset)
 
     wanted = group_name.strip() or "Base"
-    groups = getVarsetVariableGroups(varset_name, ctx=ctx)
-    filtered = [n for n in names if groups.get(n, "Base") == wanted]
-    filtered.sort()
-    return filtered
+    return sorted(
+        name
+        for name in _iter_varset_variable_names(varset)
+        if _get_varset_property_group(varset, name) == wanted
+    )
 
 
 def getVarsetVariableNames(
@@ -227,11 +185,7 @@ def getVarsetVariableNames(
         Sorted list of variable/property names. Built-in FreeCAD properties
         (Label, Placement, etc.) are excluded.
     """
-    doc = get_port(ctx).get_active_document()
-    if doc is None:
-        return []
-
-    varset = get_port(ctx).get_typed_object(doc, varset_name, type_id="App::VarSet")
+    varset = _get_active_varset(varset_name, ctx=ctx)
     if varset is None:
         return []
 
@@ -252,28 +206,103 @@ def getVarsetReferences(
             all expressions containing `<<VarSet>>` are considered.
 
     Returns:
-        Mapping of ``"Object.Property"`` -> expression string.
+        Mapping of ``"Object.Property"`` -> expression string. The mapping is
+        a fresh copy owned by the caller and may be modified.
     """
-    doc = get_port(ctx).get_active_document()
-    if doc is None:
-        return {}
+    pair = (varset_name, variable_name)
+    return getVarsetReferencesBatch([pair], ctx=ctx)[pair]
 
-    patterns, internal_var_re = _build_varset_search(
-        varset_name=varset_name,
-        variable_name=variable_name,
-    )
 
-    results: dict[str, str] = {}
-    port = get_port(ctx)
-    for obj_name, lhs, expr_text in iter_named_expression_engine_entries(doc):
-        if not _matches_varset_expression(
-            expr_text=expr_text,
-            patterns=patterns,
-            internal_var_re=internal_var_re,
-            obj=port.get_typed_object(doc, obj_name, type_id="App::VarSet") or object(),
+_VarsetTarget = tuple[dict[str, str], tuple[str, ...], Callable[[str], object] | None]
+
+
+def _build_varset_targets(
+    *,
+    port: FreeCadPort,
+    doc: object,
+    results: dict[tuple[str, str | None], dict[str, str]],
+) -> dict[str, list[_VarsetTarget]]:
+    targets: dict[str, list[_VarsetTarget]] = {}
+    varset_exists: dict[str, bool] = {}
+    for varset_name, variable_name in results:
+        patterns, internal_var_re = _build_varset_search(
             varset_name=varset_name,
-        ):
-            continue
-        key = build_expression_key(obj_name=obj_name, lhs=lhs)
-        results[key] = str(expr_text)
-    return results
+            variable_name=variable_name,
+        )
+        # Bare variable names only count inside the VarSet's own expressions, so
+        # each VarSet is resolved once here rather than looked up for every entry.
+        internal_search = None
+        if internal_var_re is not None:
+            if varset_name not in varset_exists:
+                varset = port.get_typed_object(doc, varset_name, type_id="App::VarSet")
+                varset_exists[varset_name] = varset is not None
+            if varset_exists[varset_name]:
+                internal_search = internal_var_re.search
+        found = results[(varset_name, variable_name)]
+        targets.setdefault(varset_name, []).append((found, patterns, internal_search))
+    return targets
+
+
+def getVarsetReferencesBatch(
+    pairs: Iterable[tuple[str, str | None]],
+    *,
+    ctx: FreeCadContext | None = None,
+) -> dict[tuple[str, str | None], dict[str, str]]:
+    """Find expression references for several VarSets/variables in one document pass.
+
+    Args:
+        pairs: ``(varset_name, variable_name)`` pairs, with the same meaning as
+            the arguments of `getVarsetReferences`.
+
+    Returns:
+        Mapping of each pair to its ``"Object.Property"`` -> expression mapping.
+        Results are memoized per document revision; each returned mapping is a
+        fresh copy owned by the caller and may be modified.
+    """
+    requested = list(dict.fromkeys(pairs))
+    port = get_port(ctx)
+    doc = port.get_active_document()
+    if doc is None:
+        return {pair: {} for pair in requested}
+
+    # Selection changes ask for the same variables again and again; answer
+    # repeats from a per-revision memo and scan the document only for new pairs.
+    memo: dict[tuple[str, str | None], dict[str, str]] = document_memo(doc, "varset_references")
+    results: dict[tuple[str, str | None], dict[str, str]] = {
+        pair: {} for pair in requested if pair not in memo
+    }
+    if results:
+        _scan_varset_references(port=port, doc=doc, results=results)
+        memo.update(results)
+    return {pair: dict(memo[pair]) for pair in requested}
+
+
+def _scan_varset_references(
+    *,
+    port: FreeCadPort,
+    doc: object,
+    results: dict[tuple[str, str | None], dict[str, str]],
+) -> None:
+    searches = tuple(_build_varset_targets(port=port, doc=doc, results=results).items())
+
+    # Hot loop over every expression in the document. Every qualified pattern
+    # contains the VarSet name and bare names only match in the VarSet's own
+    # expressions, so one substring test skips all variables of an unrelated
+    # VarSet. At most two literals per variable: plain `in` tests beat a
+    # generator or an alternation regex here.
+    for obj_name, lhs, text in iter_named_expression_engine_entries(doc):
+        key = None
+        for varset_name, targets in searches:
+            own = obj_name == varset_name
+            if not own and varset_name not in text:
+                continue
+            for found, patterns, internal_search in targets:
+                for pattern in patterns:
+                    if pattern in text:
+                        break
+                else:
+                    if internal_search is None or not own or internal_search(text) is None:
+                        continue
+                if key is None:
+                    key = build_expression_key(obj_name=obj_name, lhs=lhs)
+                found[key] = text
@@ -0,0 +1,97 @@
+"""Unit tests for document revision tracking and per-document memoization."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from freecad.datamanager_wb import freecad_helpers
+from freecad.datamanager_wb.ports import document_observer
+from freecad.datamanager_wb.ports.document_observer import DocumentRevisionObserver
+
+
+def test_observer_bumps_revision_only_for_the_changed_document() -> None:
+    """DocumentRevisionObserver assigns a new revision to the document owning a changed object."""
+    observer = DocumentRevisionObserver()
+    doc_a = SimpleNamespace()
+    doc_b = SimpleNamespace()
+    rev_a = observer.revision(doc_a)
+    rev_b = observer.revision(doc_b)
+
+    observer.slotChangedObject(SimpleNamespace(Document=doc_a), "ExpressionEngine")
+
+    assert observer.revision(doc_a) != rev_a
+    assert observer.revision(doc_b) == rev_b
+
+
+def test_install_document_observer_requires_observer_support(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """install_document_observer registers once and only when the app supports observers."""
+    monkeypatch.setattr(document_observer, "_observer", None)
+    assert not document_observer.install_document_observer(SimpleNamespace())
+    assert document_observer.get_document_revision(object()) is None
+
+    added: list[object] = []
+    app = SimpleNamespace(addDocumentObserver=added.append)
+    assert document_observer.install_document_observer(app)
+    assert document_observer.install_document_observer(app)
+    assert len(added) == 1
+
+
+def test_uninstall_document_observer_removes_the_installed_observer(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """uninstall_document_observer unregisters the observer and stops revision tracking."""
+    monkeypatch.setattr(document_observer, "_observer", None)
+    registered: list[object] = []
+    app = SimpleNamespace(
+        addDocumentObserver=registered.append, removeDocumentObserver=registered.remove
+    )
+    doc = SimpleNamespace()
+
+    assert document_observer.install_document_observer(app)
+    before = document_observer.get_document_revision(doc)
+    document_observer.uninstall_document_observer(app)
+    assert registered == []
+    assert document_observer.get_document_revision(doc) is None
+
+    document_observer.uninstall_document_observer(app)
+    assert document_observer.install_document_observer(app)
+    after = document_observer.get_document_revision(doc)
+    assert before is not None and after is not None and after > before
+
+
+def test_cached_for_document_reuses_result_until_document_changes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """cached_for_document recomputes only after the document revision changes."""
+    observer = DocumentRevisionObserver()
+    monkeypatch.setattr(document_observer, "_observer", observer)
+    monkeypatch.setattr(freecad_helpers, "_document_cache", {})
+    doc = SimpleNamespace()
+    calls: list[int] = []
+
+    def compute() -> int:
+        calls.append(1)
+        return len(calls)
+
+    assert freecad_helpers.cached_for_document(doc, "key", compute) == 1
+    assert freecad_helpers.cached_for_document(doc, "key", compute) == 1
+
+    observer.slotCreatedObject(SimpleNamespace(Document=doc))
+    assert freecad_helpers.cached_for_document(doc, "key", compute) == 2
+
+
+def test_cached_for_document_does_not_cache_without_observer(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """cached_for_document always recomputes when document changes are not tracked."""
+    monkeypatch.setattr(document_observer, "_observer", None)
+    calls: list[int] = []
+    doc = SimpleNamespace()
+
+    freecad_helpers.cached_for_document(doc, "key", lambda: calls.append(1))
+    freecad_helpers.cached_for_document(doc, "key", lambda: calls.append(1))
+    assert len(calls) == 2
@@ -0,0 +1,40 @@
+"""Unit tests for `ExpressionItem`."""
+
+from __future__ import annotations
+
+from freecad.datamanager_wb.domain.expression_item import ExpressionItem, by_display_text
+
+
+def test_display_text_and_equality_ignore_cached_text() -> None:
+    """ExpressionItem precomputes its display text without affecting equality or repr."""
+    item = ExpressionItem(object_name="Box", lhs="Box.Length", rhs="VS.Width", operator=":=")
+
+    assert item.display_text == "Box.Length := VS.Width"
+    assert item == ExpressionItem(
+        object_name="Box", lhs="Box.Length", rhs="VS.Width", operator=":="
+    )
+    assert hash(item) == hash(ExpressionItem("Box", "Box.Length", "VS.Width", ":="))
+    assert "_display_text" not in repr(item)
+
+
+def test_expression_item_uses_slots() -> None:
+    """ExpressionItem instances carry no per-instance `__dict__`."""
+    item = ExpressionItem(object_name="Box", lhs="Box.Length", rhs="1")
+    assert not hasattr(item, "__dict__")
+
+
+def test_by_display_text_sorts_like_display_text() -> None:
+    """by_display_text orders items the same way as their display strings."""
+    items = [
+        ExpressionItem(object_name="B", lhs="B.x", rhs="1"),
+        ExpressionItem(object_name="A", lhs="A.y", rhs="2"),
+    ]
+    assert sorted(items, key=by_display_text) == sorted(items, key=lambda i: i.display_text)
+    assert by_display_text(items[0]) == items[0].display_text
+
+
+def test_expression_item_interns_its_object_name() -> None:
+    """Equal object names share one string object across items."""
+    first = ExpressionItem(object_name="".join(["Bo", "x"]), lhs="Box.L", rhs="VS.a")
+    second = ExpressionItem(object_name="".join(["B", "ox"]), lhs="Box.L", rhs="VS.a")
+    assert first.object_name is second.object_name
@@ -0,0 +1,82 @@
+"""Unit tests for shared FreeCAD document helpers."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from freecad.datamanager_wb import freecad_helpers
+from freecad.datamanager_wb.ports import document_observer
+
+
+def test_get_copy_on_change_ids_walks_nested_groups_without_recursion(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """get_copy_on_change_ids finds typed objects below deeply nested CopyOnChange groups."""
+    monkeypatch.setattr(document_observer, "_observer", None)
+    leaf = SimpleNamespace(TypeId="App::VarSet", Name="VarSet001")
+    node = SimpleNamespace(TypeId="App::Part", Group=[leaf], OutList=[leaf])
+    for _ in range(5000):
+        node = SimpleNamespace(TypeId="App::Part", Group=[node], OutList=[])
+    group = SimpleNamespace(Label="CopyOnChangeGroup", Group=[node], OutList=[])
+    doc = SimpleNamespace(Objects=[group], getObject=lambda _name: None)
+
+    ids = freecad_helpers.get_copy_on_change_ids(doc=doc, type_id="App::VarSet")
+    assert ids == {id(leaf)}
+
+
+def test_get_document_scan_buckets_objects_in_one_pass(monkeypatch: pytest.MonkeyPatch) -> None:
+    """get_document_scan groups objects by type and collects named expression entries."""
+    monkeypatch.setattr(document_observer, "_observer", None)
+    varset = SimpleNamespace(TypeId="App::VarSet", Name="VarSet", Label="VarSet")
+    group = SimpleNamespace(TypeId="App::DocumentObjectGroup", Name="G", Label="CopyOnChangeGroup")
+    box = SimpleNamespace(
+        TypeId="Part::Box",
+        Name="Box",
+        Label="Box",
+        ExpressionEngine=[("Length", "VarSet.Width"), ("bad",)],
+    )
+    doc = SimpleNamespace(Objects=[varset, None, group, box])
+
+    scan = freecad_helpers.get_document_scan(doc)
+
+    assert scan.objects_by_type["App::VarSet"] == (varset,)
+    assert scan.copy_on_change_groups == (group,)
+    assert scan.named_expressions == (("Box", "Length", "VarSet.Width"),)
+
+
+def test_get_copy_on_change_groups_lists_the_direct_group_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """get_copy_on_change_groups does not repeat the named group found by its label."""
+    monkeypatch.setattr(document_observer, "_observer", None)
+    direct = SimpleNamespace(Name="CopyOnChangeGroup", Label="CopyOnChangeGroup")
+    other = SimpleNamespace(Name="Group001", Label="CopyOnChangeGroup001")
+    plain = SimpleNamespace(Name="Box", Label=None)
+    doc = SimpleNamespace(
+        Objects=[direct, plain, other],
+        getObject=lambda name: direct if name == "CopyOnChangeGroup" else None,
+    )
+
+    assert freecad_helpers.get_copy_on_change_groups(doc) == [direct, other]
+
+
+def test_build_expression_key_joins_object_and_property() -> None:
+    """build_expression_key inserts a dot only when the lhs does not start with one."""
+    assert freecad_helpers.build_expression_key(obj_name="Box", lhs="Length") == "Box.Length"
+    assert freecad_helpers.build_expression_key(obj_name="Box", lhs=".Placement") == "Box.Placement"
+    assert freecad_helpers.build_expression_key(obj_name="Box", lhs="") == "Box."
+
+
+def test_document_scan_skips_malformed_expression_entries(monkeypatch: pytest.MonkeyPatch) -> None:
+    """get_document_scan keeps `(lhs, expr)` entries and ignores non-iterable or short ones."""
+    monkeypatch.setattr(document_observer, "_observer", None)
+    doc = SimpleNamespace(
+        Objects=[
+            SimpleNamespace(Name="Box", ExpressionEngine=[("Length", "VS.Width"), ("Bad",), None]),
+            SimpleNamespace(Name="Cyl", ExpressionEngine=42),
+        ]
+    )
+    scan = freecad_helpers.get_document_scan(doc)
+    assert scan.named_expressions == (("Box", "Length", "VS.Width"),)
@@ -0,0 +1,29 @@
+"""Unit tests for the FreeCAD port adapter."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from freecad.datamanager_wb.ports import freecad_port
+from freecad.datamanager_wb.ports.freecad_context import FreeCadContext
+
+
+def test_get_port_builds_the_runtime_port_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    """get_port reuses the runtime-backed port but wraps explicit contexts as given."""
+    calls: list[int] = []
+
+    def _fake_runtime_context() -> FreeCadContext:
+        calls.append(1)
+        return FreeCadContext(app=SimpleNamespace(ActiveDocument=None))
+
+    monkeypatch.setattr(freecad_port, "_runtime_port", None)
+    monkeypatch.setattr(freecad_port, "get_runtime_context", _fake_runtime_context)
+
+    assert freecad_port.get_port() is freecad_port.get_port()
+    assert len(calls) == 1
+
+    doc = object()
+    ctx = FreeCadContext(app=SimpleNamespace(ActiveDocument=doc))
+    assert freecad_port.get_port(ctx).get_active_document() is doc
@@ -0,0 +1,35 @@
+"""Unit tests for the FreeCAD version check helpers."""
+
+from __future__ import annotations
+
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from freecad.datamanager_wb import freecad_version_check
+from freecad.datamanager_wb.freecad_version_check import check_supported_python_version
+
+
+def test_check_supported_python_version_compares_against_the_minimum() -> None:
+    """Versions compare lexicographically against the minimum FreeCAD release and commit."""
+    assert check_supported_python_version(1, 0, 2, 33772)
+    assert check_supported_python_version(1, 1, 0, 0)
+    assert not check_supported_python_version(1, 0, 2, 33771)
+    assert not check_supported_python_version(0, 21, 2)
+
+
+def test_parse_freecad_version_reads_the_leading_git_number(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """_parse_freecad_version keeps the commit number and treats a missing one as supported."""
+    parse = freecad_version_check._parse_freecad_version  # pylint: disable=protected-access
+    fake_app = SimpleNamespace(Version=lambda: ["1", "0", "2", "39109 (Git)"])
+    monkeypatch.setitem(sys.modules, "FreeCAD", fake_app)
+    assert parse() == (1, 0, 2, 39109)
+
+    fake_app.Version = lambda: ["1", "0", "2", " 39109\t(Git)"]
+    assert parse() == (1, 0, 2, 39109)
+
+    fake_app.Version = lambda: ["1", "0", "2", ""]
+    assert parse() == (1, 0, 2, freecad_version_check.FC_COMMIT_REQUIRED)
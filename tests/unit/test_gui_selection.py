@@ -0,0 +1,62 @@
+"""Unit tests for GUI selection helpers."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from freecad.datamanager_wb.domain.expression_item import ExpressionItem
+from freecad.datamanager_wb.ui import gui_selection
+
+
+class _FakePort:
+    """Port double that records selection calls and warnings."""
+
+    def __init__(self) -> None:
+        self.doc = SimpleNamespace(Name="Doc")
+        self.objects = {"Box": SimpleNamespace(Name="Box")}
+        self.selected: list[tuple[str, str]] = []
+        self.warnings: list[str] = []
+
+    def get_active_document(self) -> object:
+        return self.doc
+
+    def get_object(self, _doc: object, name: str) -> object | None:
+        return self.objects.get(name)
+
+    def translate(self, _context: str, text: str) -> str:
+        return text
+
+    def warn(self, text: str) -> None:
+        self.warnings.append(text)
+
+    def clear_selection(self) -> None:
+        self.selected.clear()
+
+    def add_selection(self, *, doc_name: str, obj_name: str) -> None:
+        self.selected.append((doc_name, obj_name))
+
+
+def test_select_object_from_expression_item_resolves_the_port_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """select_object_from_expression_item selects the owning object using a single port."""
+    port = _FakePort()
+    calls: list[int] = []
+
+    def _get_port(_ctx: object = None) -> _FakePort:
+        calls.append(1)
+        return port
+
+    monkeypatch.setattr(gui_selection, "get_port", _get_port)
+
+    gui_selection.select_object_from_expression_item(
+        ExpressionItem(object_name="Box", lhs="Box.Length", rhs="VS.Width")
+    )
+    assert port.selected == [("Doc", "Box")]
+    assert len(calls) == 1
+
+    gui_selection.select_object_from_expression_item("Cyl.Radius = VS.Width")
+    assert port.selected == [("Doc", "Box")]
+    assert port.warnings == ["Workbench MainPanel: cannot find object 'Cyl'\n"]
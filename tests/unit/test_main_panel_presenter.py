@@ -5,8 +5,10 @@ Includes a small fake controller to drive presenter behavior without FreeCAD.
 
 from __future__ import annotations
 
+from collections.abc import Set as AbstractSet
+
 from freecad.datamanager_wb.domain.expression_item import ExpressionItem
-from freecad.datamanager_wb.ui.main_panel_presenter import MainPanelPresenter
+from freecad.datamanager_wb.ui.main_panel_presenter import ChildListState, MainPanelPresenter
 from freecad.datamanager_wb.domain.parent_child_ref import ParentChildRef
 
 
@@ -289,3 +291,107 @@ def test_get_show_plan_with_mdi_creates_subwindow() -> None:
     assert not plan.show_standalone
     assert not plan.reuse_subwindow
     assert plan.create_subwindow
+
+
+class _CountingLabelController(FakeController):
+    """Test double that counts label lookups per object name."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.label_calls: list[str] = []
+
+    def get_object_label(self, object_name: str) -> str | None:
+        """Record the lookup and return the configured label."""
+        self.label_calls.append(object_name)
+        return super().get_object_label(object_name)
+
+
+def test_get_varset_variables_state_looks_up_each_label_once_per_render() -> None:
+    """get_varset_variables_state asks the controller once per distinct parent per render."""
+    ctrl = _CountingLabelController()
+    ctrl.labels["Var"] = "VarLabel"
+
+    p = MainPanelPresenter(ctrl)
+    for _ in range(2):
+        state = p.get_varset_variables_state(
+            selected_varsets=["Var", "Var", "Other"],
+            variable_filter_text="",
+            only_unused=False,
+            use_label=True,
+            selected_refs=set(),
+        )
+
+    assert [i.display for i in state.items] == ["VarLabel.X", "VarLabel.X", "Other.X"]
+    assert ctrl.label_calls == ["Var", "Other", "Var", "Other"]
+
+
+def test_get_spreadsheets_state_applies_glob_filter_to_labels() -> None:
+    """get_spreadsheets_state matches label-mode filters as case-sensitive globs."""
+    ctrl = FakeController()
+    ctrl.sheets = ["S1", "S2", "S3"]
+    ctrl.labels.update({"S1": "Params", "S2": "params_old", "S3": "Sizes"})
+
+    p = MainPanelPresenter(ctrl)
+
+    def displays(filter_text: str) -> list[str]:
+        state = p.get_spreadsheets_state(
+            filter_text=filter_text,
+            exclude_copy_on_change=False,
+            use_label=True,
+            selected_keys=set(),
+        )
+        return [i.display for i in state.items]
+
+    assert displays("aram") == ["Params", "params_old"]
+    assert displays("P*") == ["Params"]
+    assert displays("S?zes") == ["Sizes"]
+
+
+def test_format_parent_child_ref_name_mode_returns_text() -> None:
+    """format_parent_child_ref returns `parent.child` in name mode for refs and duck-typed objects."""
+    p = MainPanelPresenter(FakeController())
+
+    class _DuckRef:
+        text = "Sheet.alias"
+
+    assert p.format_parent_child_ref(ParentChildRef(parent="VS", child="a"), use_label=False) == "VS.a"
+    assert p.format_parent_child_ref(_DuckRef(), use_label=False) == "Sheet.alias"
+
+
+def test_get_varsets_state_name_mode_skips_label_lookups() -> None:
+    """get_varsets_state shows raw names in name mode without asking for labels."""
+    ctrl = _CountingLabelController()
+    ctrl.varsets = ["A", "B"]
+    ctrl.labels["A"] = "Ay"
+
+    p = MainPanelPresenter(ctrl)
+    state = p.get_varsets_state(
+        filter_text="",
+        exclude_copy_on_change=False,
+        use_label=False,
+        selected_keys={"B"},
+    )
+
+    assert [(i.key, i.display) for i in state.items] == [("A", "A"), ("B", "B")]
+    assert state.selected_keys == {"B"}
+    assert ctrl.label_calls == []
+
+
+def test_get_aliases_state_reuses_frozen_selection() -> None:
+    """get_aliases_state keeps a frozenset selection as-is and freezes other sets."""
+    p = MainPanelPresenter(FakeController())
+    selected = frozenset({ParentChildRef(parent="Sheet", child="Alias")})
+
+    def state_for(selected_refs: AbstractSet[ParentChildRef]) -> ChildListState:
+        return p.get_aliases_state(
+            selected_spreadsheets=["Sheet"],
+            alias_filter_text="",
+            only_unused=False,
+            use_label=False,
+            selected_refs=selected_refs,
+        )
+
+    assert state_for(selected).selected_keys is selected
+    thawed = state_for(set(selected)).selected_keys
+    assert isinstance(thawed, frozenset)
+    assert thawed == selected
@@ -0,0 +1,66 @@
+"""Unit tests for `PanelController`.
+
+These tests use a fake FreeCAD context and a fake tab controller so they can run
+without FreeCAD.
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import cast
+
+from freecad.datamanager_wb.domain.parent_child_ref import ParentChildRef
+from freecad.datamanager_wb.domain.tab_controller import TabController
+from freecad.datamanager_wb.domain.tab_datasource import RemoveUnusedResult
+from freecad.datamanager_wb.ports.freecad_context import FreeCadContext
+from freecad.datamanager_wb.ui.panel_controller import PanelController
+
+
+class FakeDocument:
+    """Test double that counts recompute calls."""
+
+    def __init__(self) -> None:
+        self.recompute_calls = 0
+
+    def recompute(self) -> None:
+        """Record a recompute."""
+        self.recompute_calls += 1
+
+
+class FakeTabController:
+    """Test double that returns a fixed remove-unused result."""
+
+    def __init__(self, result: RemoveUnusedResult) -> None:
+        self._result = result
+
+    def remove_unused_children(
+        self, _items: list[ParentChildRef] | list[str]
+    ) -> RemoveUnusedResult:
+        """Return the configured result."""
+        return self._result
+
+
+def _make_controller(result: RemoveUnusedResult) -> tuple[PanelController, FakeDocument]:
+    doc = FakeDocument()
+    ctx = FreeCadContext(app=SimpleNamespace(ActiveDocument=doc))
+    controller = PanelController(ctx=ctx)
+    controller._varsets_tab_controller = cast(TabController, FakeTabController(result))  # pylint: disable=protected-access
+    return controller, doc
+
+
+def test_remove_unused_varset_variables_recomputes_after_removal() -> None:
+    """PanelController recomputes the document when variables were removed."""
+    controller, doc = _make_controller(
+        RemoveUnusedResult(removed=["VS.a"], still_used=[], failed=[])
+    )
+    controller.remove_unused_varset_variables(["VS.a"])
+    assert doc.recompute_calls == 1
+
+
+def test_remove_unused_varset_variables_skips_recompute_when_nothing_removed() -> None:
+    """PanelController skips the recompute when the document was not modified."""
+    controller, doc = _make_controller(
+        RemoveUnusedResult(removed=[], still_used=["VS.a"], failed=[])
+    )
+    controller.remove_unused_varset_variables(["VS.a"])
+    assert doc.recompute_calls == 0
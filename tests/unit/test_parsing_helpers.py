@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import sys
+
 from freecad.datamanager_wb.domain.parent_child_ref import (
     ParentChildRef,
     normalize_parent_child_items,
@@ -44,3 +46,20 @@ def test_parse_expression_item_object_name_parses_lhs_before_equals() -> None:
     assert parse_expression_item_object_name("Obj.Length = 1") == "Obj"
     assert parse_expression_item_object_name("Obj.Length:= 1") == "Obj"
     assert parse_expression_item_object_name("NoDot = 1") is None
+
+
+def test_parse_parent_child_ref_interns_names() -> None:
+    """parse_parent_child_ref returns interned parent and child names."""
+    ref = parse_parent_child_ref("".join(["Var", "Set.", "Width"]))
+    assert ref is not None
+    assert ref.parent is sys.intern("VarSet")
+    assert ref.child is sys.intern("Width")
+
+
+def test_parent_child_ref_text_is_precomputed_and_not_compared() -> None:
+    """ParentChildRef builds its text once and compares on parent and child only."""
+    ref = ParentChildRef(parent="VS", child="Width")
+    assert ref.text == "VS.Width"
+    assert ref.text is ref.text
+    assert ref == ParentChildRef(parent="VS", child="Width")
+    assert repr(ref) == "ParentChildRef(parent='VS', child='Width')"
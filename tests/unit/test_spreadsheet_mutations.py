@@ -0,0 +1,30 @@
+"""Unit tests for spreadsheet alias mutations."""
+
+from __future__ import annotations
+
+import pytest
+
+from freecad.datamanager_wb.spreadsheets import spreadsheet_mutations
+
+
+def test_remove_spreadsheet_alias_resolves_cell_from_cell_keyed_alias_map(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """removeSpreadsheetAlias finds the cell even when getAliases returns a cell->alias map."""
+    cleared: list[tuple[str, str]] = []
+
+    class _Sheet:
+        def getAliases(self) -> dict[str, str]:
+            return {"B2": "width", "C3": "height"}
+
+        def setAlias(self, cell: str, alias: str) -> None:
+            cleared.append((cell, alias))
+
+    monkeypatch.setattr(
+        spreadsheet_mutations,
+        "_try_get_spreadsheet",
+        lambda _name, *, ctx=None: _Sheet(),
+    )
+
+    assert spreadsheet_mutations.removeSpreadsheetAlias("Sheet", "height")
+    assert cleared == [("C3", "")]
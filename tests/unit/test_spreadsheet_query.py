@@ -2,6 +2,12 @@
 
 from __future__ import annotations
 
+from types import SimpleNamespace
+
+import pytest
+
+from freecad.datamanager_wb import freecad_helpers
+from freecad.datamanager_wb.ports import document_observer
 from freecad.datamanager_wb.spreadsheets import spreadsheet_query
 
 
@@ -84,3 +90,125 @@ def test_get_spreadsheet_alias_references_does_not_match_other_spreadsheet_prefi
 
     refs = spreadsheet_query.getSpreadsheetAliasReferences("Params", "BoomSegments")
     assert list(refs.keys()) == ["LinearPattern.Occurrences"]
+
+
+def test_normalize_alias_map_keeps_mapping_when_keys_and_values_look_like_cells() -> None:
+    """_normalize_alias_map only inverts when keys are more cell-like than values."""
+    raw = {"A1": "B1", "A2": "B2"}
+    assert spreadsheet_query._normalize_alias_map(raw) == raw
+
+
+def test_iter_nonempty_cell_values_fallback_reads_each_cell_once() -> None:
+    """Without a used-cells API, the coordinate scan calls the getter once per visited cell."""
+    seen: list[str] = []
+
+    def read_cell(cell: str) -> str | None:
+        seen.append(cell)
+        return "=1" if cell in ("A2", "B3") else None
+
+    values = list(spreadsheet_query._iter_nonempty_cell_values(object(), read_cell))
+
+    assert values == [("A2", "=1"), ("B3", "=1")]
+    assert len(seen) == len(set(seen))
+
+
+def test_iter_nonempty_cell_values_fallback_finds_values_after_empty_columns() -> None:
+    """The coordinate scan still finds a value that follows two entirely empty columns."""
+
+    def read_cell(cell: str) -> str | None:
+        return {"A1": "x", "D5": "=width"}.get(cell)
+
+    values = list(spreadsheet_query._iter_nonempty_cell_values(object(), read_cell))
+
+    assert values == [("A1", "x"), ("D5", "=width")]
+
+
+def test_iter_cell_coordinates_uses_spreadsheet_column_labels() -> None:
+    """_iter_cell_coordinates walks columns A..Z, AA.. in column-major order."""
+    cells = list(spreadsheet_query._iter_cell_coordinates(max_rows=2, max_cols=28))
+    assert cells[:3] == ["A1", "A2", "B1"]
+    assert cells[-4:] == ["AA1", "AA2", "AB1", "AB2"]
+
+
+def test_get_cached_alias_map_reuses_map_until_document_changes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """_get_cached_alias_map rescans a sheet only after its document revision changes."""
+    observer = document_observer.DocumentRevisionObserver()
+    monkeypatch.setattr(document_observer, "_observer", observer)
+    monkeypatch.setattr(freecad_helpers, "_document_cache", {})
+    calls: list[int] = []
+
+    def get_aliases() -> dict[str, str]:
+        calls.append(1)
+        return {"width": "A1"}
+
+    doc = SimpleNamespace()
+    sheet = SimpleNamespace(Name="Sheet", Document=doc, getAliases=get_aliases)
+
+    assert spreadsheet_query._get_cached_alias_map(sheet) == {"width": "A1"}
+    assert spreadsheet_query._get_cached_alias_map(sheet) == {"width": "A1"}
+    assert len(calls) == 1
+
+    observer.slotChangedObject(sheet, "cells")
+    spreadsheet_query._get_cached_alias_map(sheet)
+    assert len(calls) == 2
+
+
+def test_count_cell_like_counts_whole_names_only() -> None:
+    """_count_cell_like counts names that are entirely cell addresses."""
+    assert spreadsheet_query._count_cell_like(["A1", "width", "AB12", "A1x", "x1", ""]) == 2
+    assert spreadsheet_query._count_cell_like([]) == 0
+
+
+def test_get_spreadsheet_alias_references_reads_sheet_once_per_revision(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Checking several aliases of one sheet reads its cells once until the document changes."""
+    observer = document_observer.DocumentRevisionObserver()
+    monkeypatch.setattr(document_observer, "_observer", observer)
+    monkeypatch.setattr(freecad_helpers, "_document_cache", {})
+    reads: list[str] = []
+    contents = {"A1": "10", "B1": "=width * 2", "C1": "=height"}
+
+    def get_contents(cell: str) -> str:
+        reads.append(cell)
+        return contents[cell]
+
+    doc = SimpleNamespace()
+    sheet = SimpleNamespace(
+        Name="Sheet",
+        Label="Params",
+        TypeId="Spreadsheet::Sheet",
+        Document=doc,
+        getUsedCells=lambda: list(contents),
+        getContents=get_contents,
+    )
+    box = SimpleNamespace(
+        Name="Box",
+        TypeId="Part::Box",
+        ExpressionEngine=[("Length", "<<Params>>.width + 1"), ("Width", "Other.width")],
+    )
+    doc.Objects = [sheet, box]
+
+    class _FakePort:
+        def get_active_document(self) -> object:
+            return doc
+
+        def get_typed_object(self, _doc: object, name: str, *, type_id: str) -> object | None:
+            return sheet if name == "Sheet" and type_id == "Spreadsheet::Sheet" else None
+
+    monkeypatch.setattr(spreadsheet_query, "get_port", lambda _ctx=None: _FakePort())
+
+    assert spreadsheet_query.getSpreadsheetAliasReferences("Sheet", "width") == {
+        "Sheet.B1": "=width * 2",
+        "Box.Length": "<<Params>>.width + 1",
+    }
+    assert spreadsheet_query.getSpreadsheetAliasReferences("Sheet", "height") == {
+        "Sheet.C1": "=height"
+    }
+    assert reads == ["A1", "B1", "C1"]
+
+    observer.slotChangedObject(sheet, "cells")
+    spreadsheet_query.getSpreadsheetAliasReferences("Sheet", "width")
+    assert len(reads) == 6
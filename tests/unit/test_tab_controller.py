@@ -100,3 +100,27 @@ def test_remove_unused_and_get_update_returns_post_update_items() -> None:
     assert result.remove_result.removed == ["A.x"]
     assert "A.y" in result.remove_result.still_used
     assert [r.text for r in result.update.child_items] == ["A.x"]
+
+
+def test_get_filtered_child_items_counts_only_name_matches() -> None:
+    """TabController requests reference counts only for children that pass the name filter."""
+    ds = FakeDataSource()
+    requested: list[list[str]] = []
+    original = ds.get_expression_reference_counts
+
+    def _recording_counts(selected_children: list[ParentChildRef] | list[str]) -> dict[str, int]:
+        requested.append(_normalize(selected_children))
+        return original(selected_children)
+
+    ds.get_expression_reference_counts = _recording_counts  # type: ignore[method-assign]
+    c = TabController(ds)
+    items = c.get_filtered_child_items(selected_parents=["A", "B"], child_filter_text="x", only_unused=True)
+    assert [i.text for i in items] == ["A.x"]
+    assert requested == [["A.x"]]
+
+
+def test_get_filtered_parents_explicit_glob_matches_whole_name() -> None:
+    """TabController applies explicit glob patterns against the whole parent name."""
+    c = TabController(FakeDataSource())
+    assert c.get_filtered_parents(filter_text="[AB]") == ["A", "B"]
+    assert c.get_filtered_parents(filter_text="Copy*") == ["CopyOnChange1"]
@@ -5,6 +5,10 @@ These tests mock the FreeCAD-facing query functions so they can run without Free
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+
+import pytest
+
 from freecad.datamanager_wb.domain.parent_child_ref import ParentChildRef
 from freecad.datamanager_wb.varsets.varset_datasource import VarsetDataSource
 
@@ -63,3 +67,49 @@ def test_virtual_parent_with_unknown_group_falls_back_to_normal(monkeypatch) ->
 
     refs = ds.get_child_refs(["VS.Unknown"])
     assert refs == [ParentChildRef(parent="VS", child="Unknown.x")]
+
+
+def test_get_child_refs_sorts_by_parent_child_text(monkeypatch: pytest.MonkeyPatch) -> None:
+    """VarsetDataSource.get_child_refs orders refs by their `parent.child` text across VarSets."""
+    ds = VarsetDataSource()
+
+    monkeypatch.setattr(
+        "freecad.datamanager_wb.varsets.varset_datasource.getVarsetVariableGroups",
+        lambda varset_name, *, ctx=None: {},
+    )
+    monkeypatch.setattr(
+        "freecad.datamanager_wb.varsets.varset_datasource.getVarsetVariableNames",
+        lambda varset_name, *, ctx=None: {"A": ["y", "x"], "A-b": ["z"]}[varset_name],
+    )
+
+    refs = ds.get_child_refs(["A", "A-b"])
+    assert [ref.text for ref in refs] == ["A-b.z", "A.x", "A.y"]
+    assert refs[0] == ParentChildRef(parent="A-b", child="z")
+
+
+def test_remove_unused_children_scans_all_variables_in_one_batch(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """VarsetDataSource.remove_unused_children looks up all selections in one batch."""
+    ds = VarsetDataSource()
+    batches: list[list[tuple[str, str | None]]] = []
+
+    def fake_batch(
+        pairs: Iterable[tuple[str, str | None]], *, ctx: object = None
+    ) -> dict[tuple[str, str | None], dict[str, str]]:
+        batches.append(list(pairs))
+        return {pair: ({"Box.Length": "VS.used"} if pair[1] == "used" else {}) for pair in pairs}
+
+    monkeypatch.setattr(
+        "freecad.datamanager_wb.varsets.varset_datasource.getVarsetReferencesBatch", fake_batch
+    )
+    monkeypatch.setattr(
+        "freecad.datamanager_wb.varsets.varset_datasource.removeVarsetVariable",
+        lambda varset_name, variable_name, *, ctx=None: True,
+    )
+
+    result = ds.remove_unused_children(["VS.unused", "VS.used", "bogus"])
+    assert result.removed == ["VS.unused"]
+    assert result.still_used == ["VS.used"]
+    assert result.failed == ["bogus"]
+    assert batches == [[("VS", "unused"), ("VS", "used")]]
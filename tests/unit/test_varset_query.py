@@ -0,0 +1,174 @@
+"""Unit tests for VarSet query helpers."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from types import SimpleNamespace
+
+import pytest
+
+from freecad.datamanager_wb import freecad_helpers
+from freecad.datamanager_wb.ports import document_observer
+from freecad.datamanager_wb.ports.document_observer import DocumentRevisionObserver
+from freecad.datamanager_wb.varsets import varset_query
+
+
+class _FakePort:
+    """Port double serving one document and resolving VarSets by name.
+
+    With `varsets`, only those names resolve; without it (as in the batch
+    tests) every name resolves to a fresh VarSet stand-in.
+    """
+
+    def __init__(self, *, doc: object | None = None, varsets: dict[str, object] | None = None):
+        self.doc = object() if doc is None else doc
+        self.varsets = varsets
+        self.lookups: list[str] = []
+
+    def get_active_document(self) -> object:
+        return self.doc
+
+    def get_typed_object(self, _doc: object, name: str, *, type_id: str) -> object | None:
+        self.lookups.append(name)
+        if type_id != "App::VarSet":
+            return None
+        if self.varsets is None:
+            return SimpleNamespace(Name=name)
+        return self.varsets.get(name)
+
+
+def _install_fake_port(
+    monkeypatch: pytest.MonkeyPatch,
+    port: _FakePort,
+    entries: Callable[[object], Iterator[tuple[str, str, str]]] | None = None,
+) -> None:
+    monkeypatch.setattr(varset_query, "get_port", lambda _ctx=None: port)
+    if entries is not None:
+        monkeypatch.setattr(varset_query, "iter_named_expression_engine_entries", entries)
+
+
+def test_get_varset_references_matches_bare_names_only_inside_the_varset(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """getVarsetReferences resolves the VarSet once and matches bare names only in its own expressions."""
+    port = _FakePort(varsets={"VS": SimpleNamespace(Name="VS", TypeId="App::VarSet")})
+
+    def _fake_entries(_doc: object) -> Iterator[tuple[str, str, str]]:
+        yield "VS", "Height", "Width * 2"
+        yield "Box", "Length", "Width * 2"
+        yield "Box", "Width", "VS.Width + 1"
+
+    _install_fake_port(monkeypatch, port, _fake_entries)
+
+    refs = varset_query.getVarsetReferences("VS", "Width")
+    assert refs == {"VS.Height": "Width * 2", "Box.Width": "VS.Width + 1"}
+    assert port.lookups == ["VS"]
+
+
+def test_get_varsets_excludes_copy_on_change_clones_by_identity(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """getVarsets skips VarSets reachable from a CopyOnChange group."""
+    original = SimpleNamespace(Name="VarSet", TypeId="App::VarSet", Label="VarSet")
+    clone = SimpleNamespace(Name="VarSet001", TypeId="App::VarSet", Label="VarSet")
+    group = SimpleNamespace(
+        Name="Group", TypeId="App::DocumentObjectGroup", Label="CopyOnChangeGroup", Group=[clone]
+    )
+    doc = SimpleNamespace(Objects=[original, clone, group], getObject=lambda _name: None)
+    _install_fake_port(monkeypatch, _FakePort(doc=doc))
+
+    assert list(varset_query.getVarsets()) == ["VarSet", "VarSet001"]
+    assert list(varset_query.getVarsets(exclude_copy_on_change=True)) == ["VarSet"]
+
+
+def test_get_varset_variable_names_for_group_skips_builtins_and_filters_by_group(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """getVarsetVariableNamesForGroup excludes built-in properties and sorts the group's names."""
+    groups = {"Width": "Base", "Height": "Dims", "Depth": "Dims", "Label": "Base"}
+    varset = SimpleNamespace(
+        TypeId="App::VarSet",
+        PropertiesList=["Width", "Label", "Height", "Depth", "Placement"],
+        getGroupOfProperty=groups.get,
+    )
+    _install_fake_port(monkeypatch, _FakePort(varsets={"VS": varset}))
+
+    assert varset_query.getVarsetVariableNamesForGroup("VS", None) == ["Depth", "Height", "Width"]
+    assert varset_query.getVarsetVariableNamesForGroup("VS", "Dims") == ["Depth", "Height"]
+    assert varset_query.getVarsetVariableNamesForGroup("VS", " ") == ["Width"]
+    assert varset_query.getVarsetVariableNamesForGroup("Missing", "Dims") == []
+
+
+def test_get_varset_references_batch_matches_each_pair_in_one_pass(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """getVarsetReferencesBatch returns per-pair matches from a single expression pass."""
+    passes: list[int] = []
+
+    def _fake_entries(_doc: object) -> Iterator[tuple[str, str, str]]:
+        passes.append(1)
+        yield "Box", "Length", "VS.Width + Other.Depth"
+        yield "VS", "Height", "Width * 2"
+        yield "Cyl", "Radius", "<<Other>>.Depth"
+
+    _install_fake_port(monkeypatch, _FakePort(), _fake_entries)
+
+    refs = varset_query.getVarsetReferencesBatch(
+        [("VS", "Width"), ("Other", "Depth"), ("VS", "Missing"), ("Other", None)]
+    )
+    assert refs == {
+        ("VS", "Width"): {"Box.Length": "VS.Width + Other.Depth", "VS.Height": "Width * 2"},
+        ("Other", "Depth"): {
+            "Box.Length": "VS.Width + Other.Depth",
+            "Cyl.Radius": "<<Other>>.Depth",
+        },
+        ("VS", "Missing"): {},
+        ("Other", None): {"Cyl.Radius": "<<Other>>.Depth"},
+    }
+    assert passes == [1]
+
+
+def test_get_varset_references_batch_reuses_results_until_document_changes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """getVarsetReferencesBatch scans only for pairs not seen since the last document change."""
+    observer = DocumentRevisionObserver()
+    monkeypatch.setattr(document_observer, "_observer", observer)
+    monkeypatch.setattr(freecad_helpers, "_document_cache", {})
+    doc = SimpleNamespace()
+    passes: list[int] = []
+
+    def _fake_entries(_doc: object) -> Iterator[tuple[str, str, str]]:
+        passes.append(1)
+        yield "Box", "Length", "VS.Width + VS.Depth"
+
+    _install_fake_port(monkeypatch, _FakePort(doc=doc), _fake_entries)
+
+    first = varset_query.getVarsetReferencesBatch([("VS", "Width")])
+    again = varset_query.getVarsetReferencesBatch([("VS", "Width"), ("VS", "Depth")])
+    assert again[("VS", "Width")] == first[("VS", "Width")] == {"Box.Length": "VS.Width + VS.Depth"}
+    assert again[("VS", "Depth")] == {"Box.Length": "VS.Width + VS.Depth"}
+    assert len(passes) == 2
+
+    varset_query.getVarsetReferencesBatch([("VS", "Width"), ("VS", "Depth")])
+    assert len(passes) == 2
+
+    observer.slotChangedObject(SimpleNamespace(Document=doc), "ExpressionEngine")
+    varset_query.getVarsetReferencesBatch([("VS", "Width")])
+    assert len(passes) == 3
+
+
+def test_get_varset_references_returns_mappings_the_caller_may_modify(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Changing a returned mapping does not affect the memoized result for later callers."""
+    monkeypatch.setattr(document_observer, "_observer", DocumentRevisionObserver())
+    monkeypatch.setattr(freecad_helpers, "_document_cache", {})
+
+    def _fake_entries(_doc: object) -> Iterator[tuple[str, str, str]]:
+        yield "Box", "Length", "VS.Width"
+
+    _install_fake_port(monkeypatch, _FakePort(doc=SimpleNamespace()), _fake_entries)
+
+    varset_query.getVarsetReferences("VS", "Width").clear()
+    assert varset_query.getVarsetReferences("VS", "Width") == {"Box.Length": "VS.Width"}